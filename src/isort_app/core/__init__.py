@@ -5,29 +5,97 @@
 # - organizer: File organization operations
 # - duplicates: Duplicate detection and handling
 # - inventory: File inventory management
+# - modes: Operation mode names shared with the UI
 # - worker: Background worker threads
 
-from isort_app.core.duplicates import (
-    ComparisonResult,
-    DuplicateDetector,
-    DuplicateGroup,
-    DuplicateResult,
-    FolderComparator,
-)
-from isort_app.core.hasher import HASH_ERROR, SmartHasher
-from isort_app.core.inventory import FileInventoryEntry, InventoryGenerator, InventoryResult
-from isort_app.core.metadata import (
-    VIDEO_EXTENSIONS,
-    AppleDetector,
-    BatchMetadata,
-    Destination,
-    DetectionResult,
-    MetadataExtractor,
-    get_file_extension,
-)
-from isort_app.core.organizer import FileOrganizer, OrganizationStats
-from isort_app.core.router import DestinationRouter
-from isort_app.core.worker import OrganizeWorker
+# Re-exports are resolved lazily (PEP 562) so importing one core module, e.g.
+# isort_app.core.organizer, does not pull in duplicates/inventory/worker.
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isort_app.core.duplicates import (
+        ComparisonResult,
+        DuplicateDetector,
+        DuplicateGroup,
+        DuplicateResult,
+        FolderComparator,
+    )
+    from isort_app.core.hasher import (
+        DEFAULT_HASH_ALGO,
+        DEFAULT_HASH_THREADS,
+        HASH_ERROR,
+        SmartHasher,
+    )
+    from isort_app.core.inventory import FileInventoryEntry, InventoryGenerator, InventoryResult
+    from isort_app.core.metadata import (
+        VIDEO_EXTENSIONS,
+        AppleDetector,
+        BatchMetadata,
+        Destination,
+        DetectionResult,
+        MetadataExtractor,
+        get_file_extension,
+    )
+    from isort_app.core.modes import (
+        MODE_COMPARE,
+        MODE_DUPLICATES,
+        MODE_INVENTORY,
+        MODE_ORGANIZE,
+        MODE_PREVIEW,
+        UI_MODES,
+    )
+    from isort_app.core.organizer import FileOrganizer, OrganizationStats
+    from isort_app.core.router import DestinationRouter
+    from isort_app.core.worker import OrganizeWorker
+
+# Exported name -> defining module
+_EXPORTS = {
+    "ComparisonResult": "isort_app.core.duplicates",
+    "DuplicateDetector": "isort_app.core.duplicates",
+    "DuplicateGroup": "isort_app.core.duplicates",
+    "DuplicateResult": "isort_app.core.duplicates",
+    "FolderComparator": "isort_app.core.duplicates",
+    "DEFAULT_HASH_ALGO": "isort_app.core.hasher",
+    "DEFAULT_HASH_THREADS": "isort_app.core.hasher",
+    "HASH_ERROR": "isort_app.core.hasher",
+    "SmartHasher": "isort_app.core.hasher",
+    "FileInventoryEntry": "isort_app.core.inventory",
+    "InventoryGenerator": "isort_app.core.inventory",
+    "InventoryResult": "isort_app.core.inventory",
+    "VIDEO_EXTENSIONS": "isort_app.core.metadata",
+    "AppleDetector": "isort_app.core.metadata",
+    "BatchMetadata": "isort_app.core.metadata",
+    "Destination": "isort_app.core.metadata",
+    "DetectionResult": "isort_app.core.metadata",
+    "MetadataExtractor": "isort_app.core.metadata",
+    "get_file_extension": "isort_app.core.metadata",
+    "FileOrganizer": "isort_app.core.organizer",
+    "OrganizationStats": "isort_app.core.organizer",
+    "DestinationRouter": "isort_app.core.router",
+    "MODE_ORGANIZE": "isort_app.core.modes",
+    "MODE_PREVIEW": "isort_app.core.modes",
+    "MODE_INVENTORY": "isort_app.core.modes",
+    "MODE_DUPLICATES": "isort_app.core.modes",
+    "MODE_COMPARE": "isort_app.core.modes",
+    "UI_MODES": "isort_app.core.modes",
+    "OrganizeWorker": "isort_app.core.worker",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Metadata extraction
@@ -57,6 +125,15 @@ __all__ = [
     # Hashing
     "SmartHasher",
     "HASH_ERROR",
+    "DEFAULT_HASH_THREADS",
+    "DEFAULT_HASH_ALGO",
+    # Modes
+    "MODE_ORGANIZE",
+    "MODE_PREVIEW",
+    "MODE_INVENTORY",
+    "MODE_DUPLICATES",
+    "MODE_COMPARE",
+    "UI_MODES",
     # Worker
     "OrganizeWorker",
 ]
@@ -19,14 +19,22 @@ Usage:
 
 import csv
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Tuple
-
-from isort_app.core.hasher import HASH_ERROR, SmartHasher
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from isort_app.core.hasher import (
+    DEFAULT_HASH_ALGO,
+    DEFAULT_HASH_THREADS,
+    HASH_ERROR,
+    HASH_THRESHOLD,
+    SmartHasher,
+)
 from isort_app.core.metadata import VIDEO_EXTENSIONS, MetadataExtractor, get_file_extension
 from isort_app.core.organizer import format_file_size
+from isort_app.utils.walk import WalkFunction, walk_fast
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +43,9 @@ ProgressCallback = Callable[[int, int], None]
 ProgressCallbackWithLabel = Callable[[int, int, str], None]
 ErrorLogCallback = Callable[[str, str, str], None]  # context, file, error
 
+# Leading bytes hashed to cull same-size candidates before full hashing
+PARTIAL_HASH_BYTES = 64 * 1024
+
 
 @dataclass
 class DuplicateGroup:
@@ -90,26 +101,42 @@ class DuplicateDetector:
     """
     Single-folder duplicate detection using hash-based grouping.
 
-    Scans a folder recursively, computes smart hashes for all files,
-    groups files by hash, and generates TXT/CSV reports of duplicates.
+    Scans a folder recursively and narrows candidates in three phases:
+    1. Group by file size (files with a unique size cannot be duplicates)
+    2. Hash the first partial_hash_bytes of same-size files
+    3. Compute the full smart hash only for files whose prefixes match
+
+    Groups files by full hash and generates TXT/CSV reports of duplicates.
     """
 
     def __init__(
         self,
-        progress_callback: Optional[ProgressCallback] = None,
+        progress_callback: Optional[ProgressCallbackWithLabel] = None,
         error_log_callback: Optional[ErrorLogCallback] = None,
+        num_threads: Optional[int] = None,
+        hash_algo: str = DEFAULT_HASH_ALGO,
+        partial_hash_bytes: int = PARTIAL_HASH_BYTES,
+        walk_fn: WalkFunction = walk_fast,
     ):
         """
         Initialize the DuplicateDetector.
 
         Args:
-            progress_callback: Called with (current, total) every 50 files
+            progress_callback: Called with (current, total, phase) every 50 files,
+                               where phase is "size", "partial" or "full"
             error_log_callback: Called with (context, file, error) for persistent logging
+            num_threads: Number of hashing threads (default: DEFAULT_HASH_THREADS)
+            hash_algo: Digest algorithm for content hashing (see SmartHasher)
+            partial_hash_bytes: Prefix size for the partial-hash phase (0 disables it)
+            walk_fn: Recursive regular-file lister (default: utils.walk.walk_fast)
         """
-        self.hasher = SmartHasher()
+        self.hasher = SmartHasher(hash_algo)
         self.extractor = MetadataExtractor()
         self.progress_callback = progress_callback
         self.error_log_callback = error_log_callback
+        self.num_threads = max(1, num_threads or DEFAULT_HASH_THREADS)
+        self.partial_hash_bytes = max(0, partial_hash_bytes)
+        self.walk_fn = walk_fn
 
     def find_duplicates(
         self,
@@ -141,61 +168,90 @@ class DuplicateDetector:
 
         # Scan all files
         logger.info("Scanning folder for duplicates: %s", folder_path)
-        all_files = [f for f in folder_path.rglob("*") if f.is_file()]
+        all_files = list(self.walk_fn(folder_path))
         total = len(all_files)
         result.total_files = total
 
-        # Build hash-to-files mapping (may be empty if no files)
-        hash_map: Dict[str, List[Tuple[Path, int, Optional[str]]]] = {}
-
+        # Phase 1: group by size
+        size_map: Dict[int, List[Path]] = {}
         for i, filepath in enumerate(all_files):
             try:
-                # Compute hash
-                file_hash = self.hasher.compute_hash(str(filepath))
-                if file_hash == HASH_ERROR:
-                    logger.error("Failed to hash file: %s", filepath)
-                    if self.error_log_callback:
-                        self.error_log_callback(
-                            "HASH_ERROR", str(filepath), "Failed to compute MD5 hash"
-                        )
-                    result.errors += 1
-                    continue
-
-                # Get file size
                 file_size = filepath.stat().st_size
-
-                # Get video duration if applicable
-                ext = get_file_extension(str(filepath))
-                duration: Optional[str] = None
-                if ext in VIDEO_EXTENSIONS:
-                    dur, _, _ = self.extractor.get_video_metadata(str(filepath))
-                    duration = dur if dur else None
-
-                # Add to hash map
-                if file_hash not in hash_map:
-                    hash_map[file_hash] = []
-                hash_map[file_hash].append((filepath, file_size, duration))
-
-            except (OSError, PermissionError) as e:
-                logger.error("Error processing file %s: %s", filepath, e)
-                if self.error_log_callback:
-                    self.error_log_callback("FILE_ERROR", str(filepath), str(e))
+            except OSError as e:
+                self._log_file_error(filepath, e)
                 result.errors += 1
                 continue
 
-            # Progress callback every 50 files
-            if self.progress_callback and ((i + 1) % 50 == 0 or i == total - 1):
-                self.progress_callback(i + 1, total)
+            if file_size not in size_map:
+                size_map[file_size] = []
+            size_map[file_size].append(filepath)
+
+            if self.progress_callback and (i + 1) % 50 == 0:
+                self.progress_callback(i + 1, total, "size")
+        # Every phase ends with a terminal report, even when its last file
+        # failed, so the weighted progress bar never stalls between phases
+        if self.progress_callback:
+            self.progress_callback(total, total, "size")
+
+        # Largest size bands first, so the slowest hashes start early and the
+        # pool does not finish on a long tail of big files
+        candidates: List[Tuple[Path, int, Optional[str]]] = [
+            (filepath, size, None)
+            for size, paths in sorted(size_map.items(), reverse=True)
+            if len(paths) >= 2
+            for filepath in paths
+        ]
+
+        # Phase 2: hash file prefixes; full-file digests for small files are
+        # kept and reused in phase 3
+        known_full: Dict[Path, str] = {}
+        if self.partial_hash_bytes and candidates:
+            prefix_bytes = self.partial_hash_bytes
+            partial_map: Dict[Tuple[int, str], List[Tuple[Path, int, Optional[str]]]] = {}
+            for filepath, size, prefix_hash in self._hash_candidates(
+                candidates,
+                "partial",
+                lambda p, _size: self.hasher.compute_prefix_hash(str(p), prefix_bytes),
+                result,
+            ):
+                if size <= prefix_bytes and size < HASH_THRESHOLD:
+                    known_full[filepath] = prefix_hash
+                key = (size, prefix_hash)
+                if key not in partial_map:
+                    partial_map[key] = []
+                partial_map[key].append((filepath, size, prefix_hash))
+
+            candidates = [
+                entry for entries in partial_map.values() if len(entries) >= 2
+                for entry in entries
+            ]
+        elif self.progress_callback:
+            # Phase skipped (disabled or no candidates): report it complete
+            self.progress_callback(0, 0, "partial")
+
+        # Phase 3: full smart hash for remaining candidates, grouped per size
+        # band so files of different sizes never share a group
+        hash_map: Dict[Tuple[int, str], List[Tuple[Path, int, Optional[str]]]] = {}
+        for filepath, size, file_hash in self._hash_candidates(
+            candidates,
+            "full",
+            lambda p, size: known_full.get(p) or self.hasher.compute_hash(str(p), size),
+            result,
+        ):
+            key = (size, file_hash)
+            if key not in hash_map:
+                hash_map[key] = []
+            hash_map[key].append((filepath, size, None))
 
         # Filter to only duplicates (2+ files with same hash)
         duplicate_groups: List[DuplicateGroup] = []
-        for file_hash, files in hash_map.items():
+        for (_, file_hash), files in hash_map.items():
             if len(files) >= 2:
                 group = DuplicateGroup(
                     hash=file_hash,
                     file_size=files[0][1],  # All files have same size
                     file_paths=[f[0] for f in files],
-                    video_durations=[f[2] for f in files],
+                    video_durations=[self._get_duration(f[0]) for f in files],
                 )
                 duplicate_groups.append(group)
                 result.duplicate_files += len(files)
@@ -227,6 +283,70 @@ class DuplicateDetector:
 
         return result
 
+    def _hash_candidates(
+        self,
+        candidates: List[Tuple[Path, int, Optional[str]]],
+        phase: str,
+        hash_func: Callable[[Path, int], str],
+        result: DuplicateResult,
+    ) -> Iterator[Tuple[Path, int, str]]:
+        """
+        Hash candidate files on a thread pool.
+
+        Results are consumed in input order on the calling thread, so
+        callbacks fire from one thread and grouping order is deterministic.
+        Files that fail to hash are logged, counted in result.errors and
+        skipped. Progress is reported every 50 files and once at the end,
+        including when there are no candidates.
+
+        Yields:
+            Tuple of (path, size, hash) for each successfully hashed file
+        """
+        total = len(candidates)
+        hash_label = self.hasher.algorithm.upper()
+        paths = [c[0] for c in candidates]
+        sizes = [c[1] for c in candidates]
+
+        executor = ThreadPoolExecutor(max_workers=self.num_threads)
+        try:
+            for i, ((filepath, size, _), file_hash) in enumerate(
+                zip(candidates, executor.map(hash_func, paths, sizes))
+            ):
+                if self.progress_callback and (i + 1) % 50 == 0:
+                    self.progress_callback(i + 1, total, phase)
+
+                if file_hash == HASH_ERROR:
+                    logger.error("Failed to hash file: %s", filepath)
+                    if self.error_log_callback:
+                        self.error_log_callback(
+                            "HASH_ERROR",
+                            str(filepath),
+                            f"Failed to compute {hash_label} hash",
+                        )
+                    result.errors += 1
+                    continue
+
+                yield filepath, size, file_hash
+
+            if self.progress_callback:
+                self.progress_callback(total, total, phase)
+        finally:
+            # Drop queued work if a callback raised (e.g. StopRequested)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_duration(self, filepath: Path) -> Optional[str]:
+        """Return video duration for video files, None otherwise."""
+        if get_file_extension(str(filepath)) not in VIDEO_EXTENSIONS:
+            return None
+        dur, _, _ = self.extractor.get_video_metadata(str(filepath))
+        return dur if dur else None
+
+    def _log_file_error(self, filepath: Path, error: OSError) -> None:
+        """Log a per-file OS error to logger and error log callback."""
+        logger.error("Error processing file %s: %s", filepath, error)
+        if self.error_log_callback:
+            self.error_log_callback("FILE_ERROR", str(filepath), str(error))
+
     def _write_duplicate_report(
         self,
         groups: List[DuplicateGroup],
@@ -237,6 +357,7 @@ class DuplicateDetector:
     ) -> None:
         """Write duplicate detection reports in TXT and CSV formats."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        hash_label = self.hasher.algorithm.upper()
 
         # Write TXT report
         with open(txt_path, "w", encoding="utf-8") as f:
@@ -267,7 +388,7 @@ class DuplicateDetector:
                     "┌────────────────────────────────────────────────────────────────────────────────┐\n"
                 )
                 f.write(
-                    f"│  📦 Duplicate Group #{i} (MD5: {hash_short}){' ' * (46 - len(str(i)) - len(hash_short))}│\n"
+                    f"│  📦 Duplicate Group #{i} ({hash_label}: {hash_short}){' ' * (49 - len(str(i)) - len(hash_label) - len(hash_short))}│\n"
                 )
                 f.write(
                     "├────────────────────────────────────────────────────────────────────────────────┤\n"
@@ -320,7 +441,7 @@ class DuplicateDetector:
             writer = csv.writer(f, quoting=csv.QUOTE_ALL)
             writer.writerow(
                 [
-                    "MD5 Hash",
+                    f"{hash_label} Hash",
                     "File Size",
                     "Duration",
                     "Filename",
@@ -472,7 +593,7 @@ class FolderComparator:
         total_size = 0
         errors = 0
 
-        all_files = [f for f in folder_path.rglob("*") if f.is_file()]
+        all_files = list(walk_fast(folder_path))
         total = len(all_files)
 
         for i, filepath in enumerate(all_files):
@@ -615,6 +736,7 @@ class FolderComparator:
 
 
 __all__ = [
+    "PARTIAL_HASH_BYTES",
     "DuplicateGroup",
     "DuplicateResult",
     "DuplicateDetector",
@@ -2,7 +2,7 @@
 """
 Smart partial hashing module for efficient duplicate detection.
 
-For files under 100MB, computes full MD5 hash.
+For files under 100MB, computes full hash.
 For files >= 100MB, computes partial hash using:
 - First 1MB chunk
 - Middle 1MB chunk
@@ -11,12 +11,20 @@ For files >= 100MB, computes partial hash using:
 
 This approach provides fast hashing for large video files while
 maintaining uniqueness for duplicate detection.
+
+The digest algorithm is selectable: MD5 (default, ZSH-compatible),
+BLAKE2b, or xxHash64 when the optional ``xxhash`` package is installed.
 """
 
 import hashlib
 import logging
 import os
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+try:
+    import xxhash  # pyright: ignore[reportMissingImports]
+except ImportError:  # Optional dependency
+    xxhash = None
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +34,36 @@ HASH_THRESHOLD = 100 * 1024 * 1024
 # 1MB chunk size for partial hashing
 CHUNK_SIZE = 1024 * 1024
 
+# Default worker threads for parallel hashing (overlaps disk I/O with CPU work)
+DEFAULT_HASH_THREADS = max(2, (os.cpu_count() or 2) // 2)
+
 
 # Error sentinel matching ZSH script behavior
 HASH_ERROR = "ERROR"
 
+# Default algorithm (matches the ZSH script's MD5 output)
+DEFAULT_HASH_ALGO = "md5"
+
+# Supported algorithms -> hash object factories
+HASH_ALGORITHMS: Dict[str, Callable] = {
+    "md5": hashlib.md5,
+    "blake2b": lambda: hashlib.blake2b(digest_size=16),
+}
+# Fallback used when xxh64 is requested but xxhash is not installed
+XXHASH_FALLBACK_ALGO = "blake2b"
+
+if xxhash is not None:
+    HASH_ALGORITHMS["xxh64"] = xxhash.xxh64
+else:
+    # Logged once per process rather than for every SmartHasher
+    logger.info("xxhash not installed - xxh64 falls back to %s", XXHASH_FALLBACK_ALGO)
+
 
 class SmartHasher:
     """
     Smart file hasher with partial hashing for large files.
 
-    Files < 100MB: Full MD5 hash
+    Files < 100MB: Full hash
     Files >= 100MB: Partial hash (start + middle + end chunks + size)
 
     Note: Hash output is compatible with the ZSH compute_smart_hash function.
@@ -43,18 +71,36 @@ class SmartHasher:
     On error, returns "ERROR" sentinel to match ZSH script behavior.
     """
 
-    def compute_hash(self, filepath: str) -> str:
+    def __init__(self, algorithm: str = DEFAULT_HASH_ALGO):
+        """
+        Initialize the SmartHasher.
+
+        Args:
+            algorithm: Digest algorithm name ("md5", "blake2b", "xxh64").
+                       "xxh64" falls back to "blake2b" if xxhash is missing.
+        """
+        if algorithm == "xxh64" and "xxh64" not in HASH_ALGORITHMS:
+            algorithm = XXHASH_FALLBACK_ALGO
+        if algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+        self.algorithm = algorithm
+        self._new_hash = HASH_ALGORITHMS[algorithm]
+
+    def compute_hash(self, filepath: str, file_size: Optional[int] = None) -> str:
         """
         Compute hash for a file using smart partial hashing.
 
         Args:
             filepath: Path to the file to hash
+            file_size: Known file size in bytes (skips a stat call if given)
 
         Returns:
-            Hexadecimal MD5 hash string, or "ERROR" sentinel on failure
+            Hexadecimal hash string, or "ERROR" sentinel on failure
         """
         try:
-            file_size = os.path.getsize(filepath)
+            if file_size is None:
+                file_size = os.path.getsize(filepath)
 
             if file_size < HASH_THRESHOLD:
                 return self._compute_full_hash(filepath)
@@ -71,17 +117,41 @@ class SmartHasher:
             logger.error("OS error hashing %s: %s", filepath, e)
             return HASH_ERROR
 
+    def compute_prefix_hash(self, filepath: str, num_bytes: int) -> str:
+        """
+        Hash only the first num_bytes of a file.
+
+        Used as a cheap pre-filter before full hashing. For files no larger
+        than num_bytes (and under HASH_THRESHOLD) the result equals
+        compute_hash(), since the whole file is read.
+
+        Args:
+            filepath: Path to the file to hash
+            num_bytes: Number of leading bytes to hash
+
+        Returns:
+            Hexadecimal hash string, or "ERROR" sentinel on failure
+        """
+        try:
+            hasher = self._new_hash()
+            with open(filepath, "rb") as f:
+                hasher.update(f.read(num_bytes))
+            return hasher.hexdigest()
+        except OSError as e:
+            logger.error("OS error hashing %s: %s", filepath, e)
+            return HASH_ERROR
+
     def _compute_full_hash(self, filepath: str) -> str:
         """
-        Compute full MD5 hash of a file.
+        Compute full hash of a file.
 
         Args:
             filepath: Path to the file
 
         Returns:
-            Hexadecimal MD5 hash string
+            Hexadecimal hash string
         """
-        hasher = hashlib.md5()
+        hasher = self._new_hash()
 
         with open(filepath, "rb") as f:
             # Read in chunks to handle memory efficiently
@@ -102,9 +172,9 @@ class SmartHasher:
             file_size: Size of the file in bytes
 
         Returns:
-            Hexadecimal MD5 hash string
+            Hexadecimal hash string
         """
-        hasher = hashlib.md5()
+        hasher = self._new_hash()
 
         # Calculate offsets
         middle_offset = (file_size // 2) - (CHUNK_SIZE // 2)
@@ -149,5 +219,8 @@ __all__ = [
     "SmartHasher",
     "HASH_THRESHOLD",
     "CHUNK_SIZE",
+    "DEFAULT_HASH_THREADS",
+    "DEFAULT_HASH_ALGO",
+    "HASH_ALGORITHMS",
     "HASH_ERROR",
 ]
@@ -19,14 +19,16 @@ Usage:
 
 import csv
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
-from isort_app.core.hasher import HASH_ERROR, SmartHasher
+from isort_app.core.hasher import DEFAULT_HASH_THREADS, HASH_ERROR, SmartHasher
 from isort_app.core.metadata import MetadataExtractor
 from isort_app.core.organizer import format_file_size
+from isort_app.utils.walk import WalkFunction, walk_fast
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +84,8 @@ class InventoryGenerator:
         self,
         progress_callback: Optional[ProgressCallback] = None,
         error_log_callback: Optional[ErrorLogCallback] = None,
+        num_threads: Optional[int] = None,
+        walk_fn: WalkFunction = walk_fast,
     ):
         """
         Initialize the InventoryGenerator.
@@ -89,11 +93,15 @@ class InventoryGenerator:
         Args:
             progress_callback: Called with (current, total) every 10 files
             error_log_callback: Called with (context, file, error) for persistent logging
+            num_threads: Number of extraction threads (default: DEFAULT_HASH_THREADS)
+            walk_fn: Recursive regular-file lister (default: utils.walk.walk_fast)
         """
         self.hasher = SmartHasher()
         self.extractor = MetadataExtractor()
         self.progress_callback = progress_callback
         self.error_log_callback = error_log_callback
+        self.num_threads = max(1, num_threads or DEFAULT_HASH_THREADS)
+        self.walk_fn = walk_fn
 
     def generate_inventory(
         self,
@@ -126,7 +134,7 @@ class InventoryGenerator:
         # Scan all files
         logger.info("Generating inventory for: %s", folder_path)
         all_files = sorted(
-            [f for f in folder_path.rglob("*") if f.is_file()],
+            self.walk_fn(folder_path),
             key=lambda p: (p.parent, p.name),
         )
         total = len(all_files)
@@ -135,13 +143,31 @@ class InventoryGenerator:
         # Group entries by directory
         entries_by_dir: Dict[str, List[FileInventoryEntry]] = {}
 
-        for i, filepath in enumerate(all_files):
-            try:
-                entry, hash_error = self._extract_file_metadata(filepath, folder_path)
+        # Extract metadata on a thread pool; results are consumed in input
+        # order on this thread so callbacks and report ordering are unchanged
+        executor = ThreadPoolExecutor(max_workers=self.num_threads)
+        try:
+            results = executor.map(
+                lambda p: self._extract_file_metadata_safe(p, folder_path), all_files
+            )
+            for i, (filepath, (entry, hash_error, error)) in enumerate(
+                zip(all_files, results)
+            ):
+                if entry is None:
+                    logger.error("Error processing file %s: %s", filepath, error)
+                    if self.error_log_callback:
+                        self.error_log_callback("FILE_ERROR", str(filepath), str(error))
+                    result.errors += 1
+                    continue
+
                 result.total_size_bytes += entry.size_bytes
 
                 # Count hash failures as errors
                 if hash_error:
+                    if self.error_log_callback:
+                        self.error_log_callback(
+                            "HASH_ERROR", str(filepath), "Failed to compute MD5 hash"
+                        )
                     result.errors += 1
 
                 # Group by directory
@@ -149,16 +175,12 @@ class InventoryGenerator:
                     entries_by_dir[entry.directory] = []
                 entries_by_dir[entry.directory].append(entry)
 
-            except (OSError, PermissionError) as e:
-                logger.error("Error processing file %s: %s", filepath, e)
-                if self.error_log_callback:
-                    self.error_log_callback("FILE_ERROR", str(filepath), str(e))
-                result.errors += 1
-                continue
-
-            # Progress callback every 10 files
-            if self.progress_callback and ((i + 1) % 10 == 0 or i == total - 1):
-                self.progress_callback(i + 1, total)
+                # Progress callback every 10 files
+                if self.progress_callback and ((i + 1) % 10 == 0 or i == total - 1):
+                    self.progress_callback(i + 1, total)
+        finally:
+            # Drop queued work if a callback raised (e.g. StopRequested)
+            executor.shutdown(wait=True, cancel_futures=True)
 
         result.directories_count = len(entries_by_dir)
 
@@ -182,6 +204,23 @@ class InventoryGenerator:
 
         return result
 
+    def _extract_file_metadata_safe(
+        self,
+        filepath: Path,
+        root_folder: Path,
+    ) -> tuple[Optional[FileInventoryEntry], bool, Optional[OSError]]:
+        """
+        Pool-thread wrapper around _extract_file_metadata that captures OSError.
+
+        Returns:
+            Tuple of (entry, hash_error_occurred, error); entry is None on error
+        """
+        try:
+            entry, hash_error = self._extract_file_metadata(filepath, root_folder)
+            return entry, hash_error, None
+        except OSError as e:
+            return None, False, e
+
     def _extract_file_metadata(
         self,
         filepath: Path,
@@ -210,13 +249,9 @@ class InventoryGenerator:
 
         # Compute hash
         hash_error = False
-        md5_hash = self.hasher.compute_hash(str(filepath))
+        md5_hash = self.hasher.compute_hash(str(filepath), size_bytes)
         if md5_hash == HASH_ERROR:
             logger.error("Failed to compute hash: %s", filepath)
-            if self.error_log_callback:
-                self.error_log_callback(
-                    "HASH_ERROR", str(filepath), "Failed to compute MD5 hash"
-                )
             md5_hash = "ERROR"
             hash_error = True
 
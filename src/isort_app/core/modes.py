@@ -0,0 +1,27 @@
+# core/modes.py
+"""
+Operation mode names shared by the UI and OrganizeWorker.
+
+Each name is both the mode combo box label and the worker's mode
+argument, so renaming a mode here updates every check that uses it.
+Kept free of Qt and core imports so the UI can load it at startup.
+"""
+
+MODE_ORGANIZE = "Organize Files"
+MODE_PREVIEW = "Preview Only (Dry Run)"
+MODE_INVENTORY = "Generate Inventory"
+MODE_DUPLICATES = "Find Duplicates"
+# Accepted by OrganizeWorker but not offered in the UI yet
+MODE_COMPARE = "Compare Folders"
+
+# Modes offered in the mode combo box, in display order
+UI_MODES = (MODE_ORGANIZE, MODE_PREVIEW, MODE_INVENTORY, MODE_DUPLICATES)
+
+__all__ = [
+    "MODE_ORGANIZE",
+    "MODE_PREVIEW",
+    "MODE_INVENTORY",
+    "MODE_DUPLICATES",
+    "MODE_COMPARE",
+    "UI_MODES",
+]
@@ -15,9 +15,9 @@ import logging
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional, Tuple, Union
+from typing import Callable, Optional, Set, Tuple, Union
 
-from isort_app.core.hasher import HASH_ERROR, SmartHasher
+from isort_app.core.hasher import DEFAULT_HASH_ALGO, HASH_ERROR, SmartHasher
 from isort_app.core.metadata import Destination
 from isort_app.core.router import DestinationRouter
 
@@ -124,6 +124,7 @@ CheckpointCallback = Callable[[str, int, Union[str, Path]], None]
 ManifestCallback = Callable[[Path, Path], None]
 FileCallback = Callable[[str, str, str], None]  # filename, destination, status
 ErrorLogCallback = Callable[[str, str, str], None]  # context, file, error
+ShouldStopCallback = Callable[[], bool]
 
 
 @dataclass
@@ -180,6 +181,8 @@ class FileOrganizer:
         manifest_callback: Optional[ManifestCallback] = None,
         file_callback: Optional[FileCallback] = None,
         error_log_callback: Optional[ErrorLogCallback] = None,
+        should_stop: Optional[ShouldStopCallback] = None,
+        hash_algo: str = DEFAULT_HASH_ALGO,
     ):
         """
         Initialize the FileOrganizer.
@@ -193,11 +196,16 @@ class FileOrganizer:
             manifest_callback: Called with (source, dest) for undo support
             file_callback: Called with (filename, destination, status) per file
             error_log_callback: Called with (context, file, error) for persistent logging
+            should_stop: Optional callable returning True to stop before the next file
+            hash_algo: Digest algorithm used for move verification (see SmartHasher)
         """
         self.router = DestinationRouter()
-        self.hasher = SmartHasher()
+        self.hasher = SmartHasher(hash_algo)
         self.stats = OrganizationStats()
 
+        # Destination counters changed since the last pop_dirty_stats() call
+        self._dirty_stats: Set[str] = set()
+
         self.verify_hash = verify_hash
         self.dry_run = dry_run
 
@@ -207,6 +215,12 @@ class FileOrganizer:
         self.manifest_callback = manifest_callback
         self.file_callback = file_callback
         self.error_log_callback = error_log_callback
+        self.should_stop = should_stop
+
+    def _check_stop(self) -> None:
+        """Raise StopRequested if the should_stop callback reports a stop."""
+        if self.should_stop is not None and self.should_stop():
+            raise StopRequested()
 
     def _log(self, message: str) -> None:
         """Log message to both logger and callback if provided."""
@@ -379,6 +393,8 @@ class FileOrganizer:
             if i < resume_index:
                 continue
 
+            self._check_stop()
+
             original_filename = source.name
             new_filename = generate_unique_filename(original_filename, folder_path)
             dest = folder_path / new_filename
@@ -458,6 +474,21 @@ class FileOrganizer:
         attr = stat_map.get(destination)
         if attr:
             setattr(self.stats, attr, getattr(self.stats, attr) + 1)
+            self._dirty_stats.add(attr)
+
+    def pop_dirty_stats(self) -> Set[str]:
+        """
+        Return and reset the destination counters changed since the last call.
+
+        Lets callers that poll stats incrementally copy only the counters
+        that actually moved instead of snapshotting every field.
+
+        Returns:
+            Set of OrganizationStats field names incremented since last poll
+        """
+        dirty = self._dirty_stats
+        self._dirty_stats = set()
+        return dirty
 
     def organize_files(
         self,
@@ -499,6 +530,8 @@ class FileOrganizer:
             if i < resume_index:
                 continue
 
+            self._check_stop()
+
             # Determine destination
             destination, detection_method = self.router.determine_destination(
                 str(source)
@@ -584,6 +617,7 @@ class FileOrganizer:
 
         # Reset stats for this run (allows reusing FileOrganizer instance)
         self.stats = OrganizationStats()
+        self._dirty_stats = set()
 
         self._log(f"Starting organization of: {folder_path}")
 
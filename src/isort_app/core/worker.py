@@ -15,16 +15,24 @@ Usage:
     worker.start()
 """
 
+import ctypes
 import logging
+import threading
 import time
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from pathlib import Path
 
 from PySide6.QtCore import QThread, Signal
 
-from isort_app.core.duplicates import DuplicateDetector
-from isort_app.core.inventory import InventoryGenerator
+from isort_app.core.hasher import DEFAULT_HASH_THREADS
+from isort_app.core.modes import (
+    MODE_COMPARE,
+    MODE_DUPLICATES,
+    MODE_INVENTORY,
+    MODE_ORGANIZE,
+    MODE_PREVIEW,
+)
 from isort_app.core.organizer import (
     FileOrganizer,
     OrganizationStats,
@@ -34,9 +42,19 @@ from isort_app.core.organizer import (
 from isort_app.utils.checkpoint import CheckpointManager
 from isort_app.utils.error_log import ErrorLogger
 from isort_app.utils.manifest import ManifestManager
+from isort_app.utils.walk import walk_fast
 
 logger = logging.getLogger(__name__)
 
+# Checkpoint throttle: save at most every N files or T seconds
+CHECKPOINT_SAVE_EVERY = 500
+CHECKPOINT_SAVE_SECONDS = 5.0
+
+# Organizer log lines are sent to the UI in batches of up to N lines, at
+# least every T seconds while lines are pending
+LOG_BATCH_SIZE = 32
+LOG_BATCH_SECONDS = 0.05
+
 
 class OrganizeWorker(QThread):
     """
@@ -56,10 +74,27 @@ class OrganizeWorker(QThread):
     log_message = Signal(
         str, str
     )  # message, level ("info"/"warning"/"error"/"success")
+    log_batch = Signal(list)  # [(message, level), ...] from the organizer
     file_processed = Signal(str, str, str)  # filename, destination, status
-    stats_updated = Signal(dict)  # stats dict with UI keys
+    stats_updated = Signal(dict)  # changed stats (UI keys) since last emit
     finished = Signal(dict)  # final stats dict
 
+    # Mode string -> handler method name
+    _MODE_HANDLERS: Dict[str, str] = {
+        MODE_ORGANIZE: "_run_organize_mode",
+        # Same as organize but dry_run=True
+        MODE_PREVIEW: "_run_organize_mode",
+        MODE_INVENTORY: "_run_inventory_mode",
+        MODE_DUPLICATES: "_run_duplicates_mode",
+    }
+
+    # Duplicate detection phase -> (progress offset, progress weight)
+    _DUPLICATE_PHASE_WEIGHTS: Dict[str, tuple] = {
+        "size": (0.0, 0.05),
+        "partial": (0.05, 0.10),
+        "full": (0.15, 0.85),
+    }
+
     def __init__(
         self,
         folder: str,
@@ -67,16 +102,23 @@ class OrganizeWorker(QThread):
         verify_hash: bool = False,
         dry_run: bool = False,
         resume: bool = False,
+        hash_algo: str = "xxh64",
+        partial_hash_bytes: Optional[int] = None,
     ):
         """
         Initialize the OrganizeWorker.
 
         Args:
             folder: Path to folder to process
-            mode: Operation mode (e.g., "Organize Files", "Find Duplicates")
+            mode: Operation mode, one of the isort_app.core.modes names
             verify_hash: If True, verify file integrity via hash comparison
             dry_run: If True, simulate operations without making changes
             resume: If True, attempt to resume from checkpoint
+            hash_algo: Digest algorithm for duplicate detection and move
+                       verification (falls back to blake2b without xxhash)
+            partial_hash_bytes: Prefix size hashed to cull duplicate candidates
+                                before full hashing (0 disables the phase,
+                                None uses the DuplicateDetector default)
         """
         super().__init__()
 
@@ -85,10 +127,22 @@ class OrganizeWorker(QThread):
         self.verify_hash = verify_hash
         self.dry_run = dry_run
         self.resume = resume
+        self.hash_algo = hash_algo
+        self.partial_hash_bytes = partial_hash_bytes
 
-        self._stop_requested = False
+        # Set by request_stop(); is_set() is cached as a plain callable so the
+        # hot progress callbacks and the organizer loop can poll it cheaply
+        self._stop = threading.Event()
+        self._stop_is_set = self._stop.is_set
         self._start_time: float = 0.0
 
+        # Live processed-file count shared with the UI, which polls it on a
+        # timer instead of receiving a dict update for every file
+        self._live_count = ctypes.c_int64(0)
+
+        # Total files scanned in duplicate mode (scale for phased progress)
+        self._dup_total = 0
+
         # Initialize stats dict with all UI keys
         # UI widgets expect "files_moved" and "files_renamed" keys
         self.stats: Dict[str, any] = {
@@ -122,9 +176,26 @@ class OrganizeWorker(QThread):
         # Error logger (initialized in run if not dry_run)
         self.error_logger: Optional[ErrorLogger] = None
 
+        # Checkpoint throttle state: last saved (phase, index, time) and the
+        # most recent unsaved position reported by the organizer
+        self._last_ckpt_phase: Optional[str] = None
+        self._last_ckpt_index = 0
+        self._last_ckpt_time = 0.0
+        self._pending_ckpt: Optional[tuple] = None
+
+        # Organizer log lines waiting to go out as one log_batch signal
+        # (dry runs log every file; one queued signal per line is costly)
+        self._log_buffer: List[Tuple[str, str]] = []
+        self._log_buffer_time = 0.0
+
+    @property
+    def live_counter(self) -> ctypes.c_int64:
+        """Shared counter of files processed so far (read via ``.value``)."""
+        return self._live_count
+
     def request_stop(self) -> None:
         """Request graceful stop of current operation."""
-        self._stop_requested = True
+        self._stop.set()
         self.log_message.emit("Stop requested by user...", "warning")
 
     def run(self) -> None:
@@ -132,7 +203,7 @@ class OrganizeWorker(QThread):
         self._start_time = time.time()
 
         # Comment 1: Verify dry_run correctness
-        if self.mode == "Preview Only (Dry Run)" and not self.dry_run:
+        if self.mode == MODE_PREVIEW and not self.dry_run:
             logger.error(
                 "Configuration Error: Preview mode selected but dry_run is False"
             )
@@ -154,15 +225,10 @@ class OrganizeWorker(QThread):
             self.error_logger.initialize()
 
         try:
-            if self.mode == "Organize Files":
-                self._run_organize_mode()
-            elif self.mode == "Preview Only (Dry Run)":
-                self._run_organize_mode()  # Same as organize but dry_run=True
-            elif self.mode == "Generate Inventory":
-                self._run_inventory_mode()
-            elif self.mode == "Find Duplicates":
-                self._run_duplicates_mode()
-            elif "Compare Folders" in self.mode:
+            handler_name = self._MODE_HANDLERS.get(self.mode)
+            if handler_name is not None:
+                getattr(self, handler_name)()
+            elif MODE_COMPARE in self.mode:
                 self._run_compare_mode()
             else:
                 self.log_message.emit(f"Unknown mode: {self.mode}", "error")
@@ -190,8 +256,13 @@ class OrganizeWorker(QThread):
             )
             self.stats["errors"] += 1
         finally:
+            self._flush_log_buffer()
             if self.error_logger:
                 self.error_logger.close()
+            # No-op after a successful organize; drains queued moves of a
+            # stopped or failed run
+            if self.manifest_mgr:
+                self.manifest_mgr.close()
             self.finished.emit(self.stats.copy())
 
     def _run_organize_mode(self) -> None:
@@ -247,7 +318,7 @@ class OrganizeWorker(QThread):
             dry_run=self.dry_run,
             progress_callback=self._on_organizer_progress,
             log_callback=self._on_organizer_log,
-            checkpoint_callback=(self.checkpoint_mgr.save if use_checkpoint else None),
+            checkpoint_callback=(self._throttled_checkpoint if use_checkpoint else None),
             manifest_callback=(
                 self.manifest_mgr.record_move if self.manifest_mgr else None
             ),
@@ -255,24 +326,36 @@ class OrganizeWorker(QThread):
             error_log_callback=(
                 self.error_logger.log_error if self.error_logger else None
             ),
+            should_stop=self._stop_is_set,
+            hash_algo=self.hash_algo,
         )
         self._organizer = organizer
 
         try:
             # Execute organization with resume support
-            organizer.organize(
-                self.folder,
-                skip_extract=False,
-                skip_cleanup=False,
-                start_phase=phase,
-                resume_index=resume_index,
-            )
+            try:
+                organizer.organize(
+                    self.folder,
+                    skip_extract=False,
+                    skip_cleanup=False,
+                    start_phase=phase,
+                    resume_index=resume_index,
+                )
+            except BaseException:
+                # Persist the latest position so a stopped/failed run resumes
+                # from where it actually got to
+                if use_checkpoint:
+                    self._flush_checkpoint()
+                raise
+            finally:
+                # Keep organizer lines ahead of the worker's own messages
+                self._flush_log_buffer()
 
             # Map OrganizationStats to UI dict
             self._map_organization_stats(organizer.stats)
 
             # Clear checkpoint on success
-            if not self._stop_requested and self.checkpoint_mgr and use_checkpoint:
+            if not self._stop_is_set() and self.checkpoint_mgr and use_checkpoint:
                 self.checkpoint_mgr.clear()
                 self.log_message.emit("Checkpoint cleared", "info")
 
@@ -297,23 +380,101 @@ class OrganizeWorker(QThread):
             self.log_message.emit(f"Organization error: {e}", "error")
             self.stats["errors"] += 1
 
-    def _map_organization_stats(self, org_stats: OrganizationStats) -> None:
-        """Map OrganizationStats dataclass to UI stats dict."""
-        self.stats["files_moved"] = org_stats.files_moved
-        self.stats["files_renamed"] = org_stats.files_renamed
-        self.stats["errors"] = org_stats.errors
-        self.stats["iphone_photos"] = org_stats.files_to_iphone_photos
-        self.stats["iphone_videos"] = org_stats.files_to_iphone_videos
-        self.stats["iphone_screenshots"] = org_stats.files_to_iphone_screenshots
-        self.stats["screenshots"] = org_stats.files_to_screenshots
-        self.stats["snapchat"] = org_stats.files_to_snapchat
-        self.stats["jpeg"] = org_stats.files_to_jpeg
-        self.stats["mp4"] = org_stats.files_to_mp4
-        self.stats["non_apple"] = org_stats.files_to_non_apple
-        self.stats["no_metadata"] = org_stats.files_no_metadata
+    def _throttled_checkpoint(
+        self, phase: str, index: int, folder_path: Path | str
+    ) -> None:
+        """
+        Checkpoint callback for FileOrganizer that limits disk writes.
+
+        Saves durably on a phase change, otherwise at most once per
+        CHECKPOINT_SAVE_EVERY files or CHECKPOINT_SAVE_SECONDS seconds
+        without fsync.
+        """
+        now = time.monotonic()
+        if phase != self._last_ckpt_phase:
+            self._flush_manifest(durable=True)
+            self.checkpoint_mgr.checkpoint_phase_boundary(phase, index, folder_path)
+        elif (
+            index - self._last_ckpt_index >= CHECKPOINT_SAVE_EVERY
+            or now - self._last_ckpt_time >= CHECKPOINT_SAVE_SECONDS
+        ):
+            self._flush_manifest()
+            self.checkpoint_mgr.save(phase, index, folder_path)
+        else:
+            self._pending_ckpt = (phase, index, folder_path)
+            return
+
+        self._last_ckpt_phase = phase
+        self._last_ckpt_index = index
+        self._last_ckpt_time = now
+        self._pending_ckpt = None
+
+    def _flush_checkpoint(self) -> None:
+        """Save the most recent throttled checkpoint position, if any."""
+        if self._pending_ckpt is not None:
+            self._flush_manifest(durable=True)
+            self.checkpoint_mgr.checkpoint_phase_boundary(*self._pending_ckpt)
+            self._pending_ckpt = None
+
+    def _flush_manifest(self, durable: bool = False) -> None:
+        """
+        Write buffered manifest records before a checkpoint is saved.
+
+        Args:
+            durable: Also fsync the manifest; used before fsynced checkpoints
+        """
+        if not self.manifest_mgr:
+            return
+        if durable:
+            self.manifest_mgr.sync()
+        else:
+            self.manifest_mgr.flush()
+
+    # OrganizationStats field -> UI stats key
+    _ORG_STAT_KEYS: Dict[str, str] = {
+        "files_moved": "files_moved",
+        "files_renamed": "files_renamed",
+        "errors": "errors",
+        "files_to_iphone_photos": "iphone_photos",
+        "files_to_iphone_videos": "iphone_videos",
+        "files_to_iphone_screenshots": "iphone_screenshots",
+        "files_to_screenshots": "screenshots",
+        "files_to_snapchat": "snapchat",
+        "files_to_jpeg": "jpeg",
+        "files_to_mp4": "mp4",
+        "files_to_non_apple": "non_apple",
+        "files_no_metadata": "no_metadata",
+    }
+
+    # General counters change on nearly every tick, so they are always sent
+    _ALWAYS_SYNCED = ("files_moved", "files_renamed", "errors")
+
+    def _map_organization_stats(
+        self,
+        org_stats: OrganizationStats,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Dict[str, int]:
+        """
+        Map OrganizationStats dataclass to UI stats dict.
+
+        Args:
+            org_stats: Organizer statistics to copy from
+            fields: OrganizationStats field names to copy (default: all)
+
+        Returns:
+            Dict of the UI keys that were updated and their new values
+        """
+        delta: Dict[str, int] = {}
+        for attr in fields if fields is not None else self._ORG_STAT_KEYS:
+            key = self._ORG_STAT_KEYS[attr]
+            delta[key] = self.stats[key] = getattr(org_stats, attr)
+        return delta
 
     def _run_inventory_mode(self) -> None:
         """Execute inventory generation."""
+        # Imported per mode to keep app startup light
+        from isort_app.core.inventory import InventoryGenerator
+
         self.log_message.emit("Starting inventory generation...", "info")
 
         generator = InventoryGenerator(
@@ -321,6 +482,8 @@ class OrganizeWorker(QThread):
             error_log_callback=(
                 self.error_logger.log_error if self.error_logger else None
             ),
+            num_threads=DEFAULT_HASH_THREADS,
+            walk_fn=walk_fast,
         )
 
         # Output reports to Desktop (consistent with ZSH script)
@@ -362,6 +525,9 @@ class OrganizeWorker(QThread):
 
     def _run_duplicates_mode(self) -> None:
         """Execute duplicate detection."""
+        # Imported per mode to keep app startup light
+        from isort_app.core.duplicates import PARTIAL_HASH_BYTES, DuplicateDetector
+
         self.log_message.emit("Starting duplicate detection...", "info")
 
         detector = DuplicateDetector(
@@ -369,6 +535,14 @@ class OrganizeWorker(QThread):
             error_log_callback=(
                 self.error_logger.log_error if self.error_logger else None
             ),
+            num_threads=DEFAULT_HASH_THREADS,
+            hash_algo=self.hash_algo,
+            partial_hash_bytes=(
+                PARTIAL_HASH_BYTES
+                if self.partial_hash_bytes is None
+                else self.partial_hash_bytes
+            ),
+            walk_fn=walk_fast,
         )
 
         # Output reports to Desktop (consistent with ZSH script)
@@ -459,20 +633,46 @@ class OrganizeWorker(QThread):
 
     def _on_organizer_progress(self, current: int, total: int) -> None:
         """Handle progress callback from FileOrganizer."""
-        if self._stop_requested:
+        if self._stop_is_set():
             raise StopRequested()
 
+        if self._organizer is not None:
+            self._live_count.value = self._organizer.stats.files_moved
         eta = self._calculate_eta(current, total)
         self.progress.emit(current, total, eta)
 
-        # Emit incremental stats every 25 files for live Statistics tab updates
+        # Don't let a lone buffered line (e.g. a phase banner) sit unseen
+        if (
+            self._log_buffer
+            and time.monotonic() - self._log_buffer_time >= LOG_BATCH_SECONDS
+        ):
+            self._flush_log_buffer()
+
+        # Emit incremental stats every 25 files for live Statistics tab updates.
+        # Only counters changed since the last emit are sent.
         if current % 25 == 0 and self._organizer is not None:
-            self._map_organization_stats(self._organizer.stats)
-            self.stats_updated.emit(self.stats.copy())
+            dirty = self._organizer.pop_dirty_stats()
+            dirty.update(self._ALWAYS_SYNCED)
+            self.stats_updated.emit(
+                self._map_organization_stats(self._organizer.stats, dirty)
+            )
 
     def _on_organizer_log(self, message: str) -> None:
-        """Handle log callback from FileOrganizer."""
-        self.log_message.emit(message, "info")
+        """Handle log callback from FileOrganizer (buffered, see log_batch)."""
+        if not self._log_buffer:
+            self._log_buffer_time = time.monotonic()
+        self._log_buffer.append((message, "info"))
+        if (
+            len(self._log_buffer) >= LOG_BATCH_SIZE
+            or time.monotonic() - self._log_buffer_time >= LOG_BATCH_SECONDS
+        ):
+            self._flush_log_buffer()
+
+    def _flush_log_buffer(self) -> None:
+        """Emit buffered organizer log lines as one log_batch signal."""
+        if self._log_buffer:
+            batch, self._log_buffer = self._log_buffer, []
+            self.log_batch.emit(batch)
 
     def _on_file_moved(self, filename: str, destination: str, status: str) -> None:
         """Handle per-file callback from FileOrganizer."""
@@ -480,9 +680,10 @@ class OrganizeWorker(QThread):
 
     def _on_inventory_progress(self, current: int, total: int) -> None:
         """Handle progress callback from InventoryGenerator."""
-        if self._stop_requested:
+        if self._stop_is_set():
             raise StopRequested()
 
+        self._live_count.value = current
         eta = self._calculate_eta(current, total)
         self.progress.emit(current, total, eta)
 
@@ -494,20 +695,34 @@ class OrganizeWorker(QThread):
             self.stats["files_moved"] = current
             self.stats_updated.emit(self.stats.copy())
 
-    def _on_duplicates_progress(self, current: int, total: int) -> None:
-        """Handle progress callback from DuplicateDetector."""
-        if self._stop_requested:
+    def _on_duplicates_progress(self, current: int, total: int, phase: str) -> None:
+        """
+        Handle phased progress callback from DuplicateDetector.
+
+        Each phase reports its own (current, total); these are folded into a
+        single weighted position over all scanned files so the progress bar
+        and ETA move monotonically across the size/partial/full phases.
+        """
+        if self._stop_is_set():
             raise StopRequested()
 
-        eta = self._calculate_eta(current, total)
-        self.progress.emit(current, total, eta)
+        if phase == "size":
+            self._dup_total = total
+        offset, weight = self._DUPLICATE_PHASE_WEIGHTS.get(phase, (0.0, 1.0))
+        fraction = offset + weight * (current / total if total else 1.0)
+        overall_total = self._dup_total or total
+        overall = min(overall_total, int(overall_total * fraction))
+
+        self._live_count.value = overall
+        eta = self._calculate_eta(overall, overall_total)
+        self.progress.emit(overall, overall_total, eta)
 
         # Emit file_processed for every file in duplicates mode
-        self.file_processed.emit(f"File {current}", "duplicates", "hashed")
+        self.file_processed.emit(f"File {current}", "duplicates", phase)
 
         # Batch stats updates every 25 files
         if current % 25 == 0:
-            self.stats["files_moved"] = current
+            self.stats["files_moved"] = overall
             self.stats_updated.emit(self.stats.copy())
 
 
@@ -3,19 +3,26 @@ iSort - Media File Organization Tool
 Entry point for the PySide6 GUI application.
 """
 
+import importlib.util
 import logging
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 
-# Ensure src/ is on sys.path for absolute imports when launched via entry point
+# Only add src/ to sys.path when running from a source checkout; an installed
+# package (entry point / app bundle) already resolves isort_app
 SRC_DIR = Path(__file__).resolve().parent.parent  # src/ directory
-if str(SRC_DIR) not in sys.path:
+if importlib.util.find_spec("isort_app") is None and str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor, QPalette
-from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtWidgets import QApplication, QMessageBox, QWidget
+
+# How often the GUI thread checks whether the dependency probe has finished
+DEPENDENCY_POLL_MS = 50
 
 
 def setup_dark_theme(app: QApplication) -> None:
@@ -31,6 +38,89 @@ def setup_dark_theme(app: QApplication) -> None:
     app.setPalette(palette)
 
 
+def start_dependency_check() -> Optional["Future[List[str]]"]:
+    """
+    Start probing for optional external tools in a background thread.
+
+    Returns:
+        Future resolving to the missing tool names, or None if the check
+        could not be started
+    """
+    try:
+        from isort_app.core.metadata import check_dependencies
+
+        # Ensure Homebrew paths are visible when launched from Finder
+        hb_paths = ["/opt/homebrew/bin", "/usr/local/bin"]
+        existing_path = os.environ.get("PATH", "")
+        expanded_path = os.pathsep.join(
+            list(
+                dict.fromkeys(
+                    hb_paths + [p for p in existing_path.split(os.pathsep) if p]
+                )
+            )
+        )
+        os.environ["PATH"] = expanded_path
+    except Exception:
+        logging.exception("Dependency check failed")
+        return None
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="isort-deps")
+    future = executor.submit(check_dependencies)
+    executor.shutdown(wait=False)
+    return future
+
+
+def report_missing_dependencies(
+    parent: QWidget, dependency_check: "Future[List[str]]"
+) -> None:
+    """
+    Warn about optional tools the background dependency check found missing.
+
+    The future is polled from a timer on the GUI thread and reported once it
+    is done, so a slow probe never blocks the event loop.
+
+    Args:
+        parent: Widget that owns the poll timer and the warning dialog
+        dependency_check: Future returned by start_dependency_check()
+    """
+    if not dependency_check.done():
+        timer = QTimer(parent)
+        timer.setInterval(DEPENDENCY_POLL_MS)
+
+        def poll() -> None:
+            if dependency_check.done():
+                timer.stop()
+                timer.deleteLater()
+                _show_missing_dependencies(parent, dependency_check)
+
+        timer.timeout.connect(poll)
+        timer.start()
+        return
+    _show_missing_dependencies(parent, dependency_check)
+
+
+def _show_missing_dependencies(
+    parent: QWidget, dependency_check: "Future[List[str]]"
+) -> None:
+    """Show the missing-tools warning for a finished dependency check."""
+    try:
+        missing = dependency_check.result()
+    except Exception:
+        logging.exception("Dependency check failed")
+        return
+    if missing:
+        msg = QMessageBox(parent)
+        msg.setIcon(QMessageBox.Icon.Warning)
+        msg.setWindowTitle("Missing Dependencies")
+        msg.setText(
+            "Optional tools not found: "
+            + ", ".join(missing)
+            + "\n\nSome features may not work.\nInstall with:\n"
+            "brew install exiftool mediainfo"
+        )
+        msg.exec()
+
+
 def main() -> int:
     """Initialize and run the application."""
     logging.basicConfig(
@@ -47,48 +137,28 @@ def main() -> int:
         QApplication.setAttribute(
             Qt.ApplicationAttribute.AA_DontShowIconsInMenus, False
         )
+    # Coalesce bursts of high-frequency events (resize/move/paint requests)
+    # during fast progress and log updates
+    if hasattr(Qt.ApplicationAttribute, "AA_CompressHighFrequencyEvents"):
+        QApplication.setAttribute(
+            Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True
+        )
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
     setup_dark_theme(app)
 
-    # Optional dependency warning for external tools
-    try:
-        from isort_app.core.metadata import check_dependencies
-
-        # Ensure Homebrew paths are visible when launched from Finder
-        hb_paths = ["/opt/homebrew/bin", "/usr/local/bin"]
-        existing_path = os.environ.get("PATH", "")
-        expanded_path = os.pathsep.join(
-            list(
-                dict.fromkeys(
-                    hb_paths + [p for p in existing_path.split(os.pathsep) if p]
-                )
-            )
-        )
-        os.environ["PATH"] = expanded_path
-
-        missing = check_dependencies()
-        if missing:
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowTitle("Missing Dependencies")
-            msg.setText(
-                "Optional tools not found: "
-                + ", ".join(missing)
-                + "\n\nSome features may not work.\nInstall with:\n"
-                "brew install exiftool mediainfo"
-            )
-            msg.exec()
-    except Exception:
-        logging.exception("Dependency check failed")
-
-    # Initialize resources
-    from isort_app.ui.resources import ResourceManager
+    # Optional dependency warning for external tools: probed while the main
+    # window is built, reported once the window is up
+    dependency_check = start_dependency_check()
 
     from isort_app.ui.main_window import MainWindow
 
     window = MainWindow()
     window.show()
+    if dependency_check is not None:
+        QTimer.singleShot(
+            0, lambda: report_missing_dependencies(window, dependency_check)
+        )
     return app.exec()
 
 
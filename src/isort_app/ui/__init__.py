@@ -4,6 +4,7 @@ UI components for iSort application.
 - main_window: MainWindow class with folder selection, mode combo, progress tracking
 - log_viewer: LogViewer widget with colored log output
 - stats_widget: StatsWidget for real-time statistics display
+- styles: MAIN_WINDOW_QSS stylesheet applied once by MainWindow
 """
 
 from .log_viewer import LogViewer
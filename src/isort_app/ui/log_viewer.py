@@ -6,13 +6,25 @@ Provides a read-only text display for log messages with level-based
 color formatting (info, success, warning, error, debug).
 """
 
-from datetime import datetime
+import time
+from collections import deque
+from typing import Iterable
 
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
-from PySide6.QtWidgets import QTextEdit
+from PySide6.QtWidgets import QPlainTextEdit
 
+# Default cap on retained log lines (oldest lines are dropped)
+DEFAULT_MAX_LOG_LINES = 5000
 
-class LogViewer(QTextEdit):
+# Pending messages are appended at most this often (~30 Hz)
+LOG_FLUSH_INTERVAL_MS = 30
+
+# Resolved once: flush() runs on every timer tick while logging
+_MOVE_END = QTextCursor.MoveOperation.End
+
+
+class LogViewer(QPlainTextEdit):
     """
     Read-only log viewer with colored, timestamped messages.
 
@@ -30,9 +42,44 @@ class LogViewer(QTextEdit):
         "debug": QColor("#888888"),
     }
 
-    def __init__(self):
+    def __init__(self, max_lines: int = DEFAULT_MAX_LOG_LINES):
+        """
+        Initialize the LogViewer.
+
+        Args:
+            max_lines: Maximum lines kept; older lines are discarded (0 = unlimited)
+        """
         super().__init__()
 
+        # Bound document size so appends stay cheap in long sessions
+        self.document().setMaximumBlockCount(max_lines)
+
+        # (epoch second, formatted timestamp) - strftime once per second
+        self._ts_cache: tuple[int, str] = (0, "")
+
+        # Messages queued by log() until the next flush; bounded like the
+        # document, since older lines would be dropped on insert anyway
+        self._pending: deque[tuple[str, str, str]] = deque(
+            maxlen=max_lines or None
+        )
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+        # Reusable character formats: timestamp (gray), level badge
+        # (colored, bold, 8-char width), message (light gray)
+        self._timestamp_format = QTextCharFormat()
+        self._timestamp_format.setForeground(QColor("#666666"))
+        self._level_formats = {}
+        for level, color in self.COLORS.items():
+            level_format = QTextCharFormat()
+            level_format.setForeground(color)
+            level_format.setFontWeight(QFont.Weight.Bold)
+            self._level_formats[level] = level_format
+        self._message_format = QTextCharFormat()
+        self._message_format.setForeground(QColor("#cccccc"))
+
         # Read-only mode
         self.setReadOnly(True)
 
@@ -44,7 +91,7 @@ class LogViewer(QTextEdit):
         # Dark background styling
         self.setStyleSheet(
             """
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1a1a1a;
                 color: #e0e0e0;
                 border-radius: 8px;
@@ -56,39 +103,73 @@ class LogViewer(QTextEdit):
 
     def log(self, message: str, level: str = "info") -> None:
         """
-        Append a log message with timestamp and level formatting.
+        Queue a log message with timestamp and level formatting.
+
+        Messages are appended in batches every LOG_FLUSH_INTERVAL_MS, so
+        bursts of logging cost one repaint instead of one per message.
+        While the viewer is hidden they stay queued until it is shown.
 
         Args:
             message: The log message text
             level: Log level (info, success, warning, error, debug)
         """
-        # Generate timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._pending.append((self._timestamp(), message, level))
+        self._schedule_flush()
 
-        # Get cursor and move to end
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-
-        # Insert timestamp (gray)
-        timestamp_format = QTextCharFormat()
-        timestamp_format.setForeground(QColor("#666666"))
-        cursor.insertText(f"[{timestamp}] ", timestamp_format)
+    def log_many(self, entries: Iterable[tuple[str, str]]) -> None:
+        """
+        Queue several log messages sharing one timestamp.
 
-        # Insert level badge (colored, bold, 8-char width)
-        level_format = QTextCharFormat()
-        level_format.setForeground(self.COLORS.get(level, self.COLORS["info"]))
-        level_format.setFontWeight(QFont.Weight.Bold)
-        level_badge = f"{level.upper():<8}"
-        cursor.insertText(level_badge, level_format)
+        Args:
+            entries: (message, level) pairs, oldest first
+        """
+        timestamp = self._timestamp()
+        self._pending.extend((timestamp, message, level) for message, level in entries)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Start the flush timer, unless hidden (showEvent flushes then)."""
+        if self._pending and self.isVisible() and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _timestamp(self) -> str:
+        """Return the current "HH:MM:SS" (cached per second), taken at queue time."""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._ts_cache[1]
+
+    def flush(self) -> None:
+        """Append all queued messages in one edit block and scroll to the end."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending = list(self._pending)
+        self._pending.clear()
 
-        # Insert message (light gray)
-        message_format = QTextCharFormat()
-        message_format.setForeground(QColor("#cccccc"))
-        cursor.insertText(f" {message}\n", message_format)
+        # Get cursor and move to end
+        cursor = self.textCursor()
+        cursor.movePosition(_MOVE_END)
+
+        # One edit block: a single document change/re-layout per batch
+        cursor.beginEditBlock()
+        for timestamp, message, level in pending:
+            cursor.insertText(f"[{timestamp}] ", self._timestamp_format)
+            cursor.insertText(
+                f"{level.upper():<8}",
+                self._level_formats.get(level, self._level_formats["info"]),
+            )
+            cursor.insertText(f" {message}\n", self._message_format)
+        cursor.endEditBlock()
 
         # Update cursor and ensure visible
         self.setTextCursor(cursor)
         self.ensureCursorVisible()
 
+    def showEvent(self, event) -> None:
+        """Append messages queued while the viewer was hidden."""
+        super().showEvent(event)
+        self.flush()
+
 
-__all__ = ["LogViewer"]
+__all__ = ["LogViewer", "DEFAULT_MAX_LOG_LINES", "LOG_FLUSH_INTERVAL_MS"]
@@ -3,14 +3,19 @@
 Main application window for iSort - matches the design mockups exactly.
 """
 
+import hashlib
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, cast
 
 from PySide6.QtCore import (
     Qt,
     Slot,
     QThread,
+    QTimer,
     Signal,
     QEasingCurve,
     QVariantAnimation,
@@ -31,24 +36,125 @@ from PySide6.QtWidgets import (
     QLabel,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QProgressBar,
     QProgressDialog,
     QPushButton,
     QSizePolicy,
     QTabWidget,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
-from isort_app.core.organizer import check_disk_space, MIN_DISK_SPACE_MB
-from isort_app.core.worker import OrganizeWorker
+from isort_app.core.modes import (
+    MODE_DUPLICATES,
+    MODE_INVENTORY,
+    MODE_ORGANIZE,
+    MODE_PREVIEW,
+    UI_MODES,
+)
 from isort_app.utils.checkpoint import CheckpointManager
 from isort_app.utils.error_log import ErrorLogger
 from isort_app.utils.manifest import ManifestUndoer, ManifestInfo, UndoResult
 from .log_viewer import LogViewer
 from .stats_widget import StatsWidget
 from .stats_detail_dialog import StatsDetailDialog
+from .styles import MAIN_WINDOW_QSS
+
+# Progress bar and "Processing: <file>" status refresh interval during a
+# run (10 Hz); worker updates in between only overwrite the pending values
+PROGRESS_FLUSH_MS = 100
+
+# Buffered worker stats are pushed to the cards/Statistics tab this often
+STATS_FLUSH_MS = 250
+
+# Undo progress dialog value/label refresh interval (10 Hz)
+UNDO_PROGRESS_UPDATE_MS = 100
+
+# Undo progress dialog is only created for undos running longer than this
+UNDO_DIALOG_MIN_DURATION_MS = 500
+
+# Leading manifest bytes hashed to spot duplicate manifests in the undo picker
+MANIFEST_FINGERPRINT_BYTES = 4096
+
+# Qt enum members used on repeated paths (card hover/value animations,
+# dialogs), resolved once instead of through the binding on every use
+_ANIM_RUNNING = QAbstractAnimation.State.Running
+_DELETE_WHEN_STOPPED = QAbstractAnimation.DeletionPolicy.DeleteWhenStopped
+_EASE_OUT = QEasingCurve.Type.OutQuad
+_EASE_IN_OUT = QEasingCurve.Type.InOutQuad
+_LEFT_BUTTON = Qt.MouseButton.LeftButton
+_YES = QMessageBox.StandardButton.Yes
+_NO = QMessageBox.StandardButton.No
+_YES_NO = _YES | _NO
+
+# Results tab label, and the label while an unseen summary is waiting
+_RESULTS_TAB_LABEL = "📁 Results"
+_RESULTS_TAB_UNSEEN_LABEL = "📁 Results ●"
+
+# Results summary boxes (filled with str.format_map over the worker stats)
+_SUMMARY_TOP = "╔════════════════════════════════════════════════════════════╗"
+_SUMMARY_SEP = "╠════════════════════════════════════════════════════════════╣"
+_SUMMARY_BOTTOM = "╚════════════════════════════════════════════════════════════╝"
+
+_INVENTORY_SUMMARY = "\n".join(
+    [
+        _SUMMARY_TOP,
+        "║                   INVENTORY COMPLETE                       ║",
+        _SUMMARY_SEP,
+        "║  Total Files:        {total_files:<38}║",
+        "║  Total Size:         {total_size_human:<38}║",
+        "║  Directories:        {directories:<38}║",
+        "║  Errors:             {errors:<38}║",
+        _SUMMARY_BOTTOM,
+    ]
+)
+
+_DUPLICATES_SUMMARY = "\n".join(
+    [
+        _SUMMARY_TOP,
+        "║                 DUPLICATE DETECTION COMPLETE               ║",
+        _SUMMARY_SEP,
+        "║  Files Scanned:      {total_files:<38}║",
+        "║  Duplicate Groups:   {duplicate_groups:<38}║",
+        "║  Duplicate Files:    {duplicate_files:<38}║",
+        "║  Wasted Space:       {wasted_space_human:<38}║",
+        _SUMMARY_BOTTOM,
+    ]
+)
+
+_ORGANIZE_SUMMARY = "\n".join(
+    [
+        _SUMMARY_TOP,
+        "║{header:^60}║",
+        _SUMMARY_SEP,
+        "║  Files Moved:        {files_moved:<38}║",
+        "║  iPhone Photos:      {iphone_photos:<38}║",
+        "║  iPhone Videos:      {iphone_videos:<38}║",
+        "║  Screenshots:        {screenshots:<38}║",
+        "║  Snapchat:           {snapchat:<38}║",
+        "║  Non-Apple:          {non_apple:<38}║",
+        "║  Errors:             {errors:<38}║",
+        _SUMMARY_BOTTOM,
+    ]
+)
+
+# Values shown when a stat is missing from the worker's results
+_SUMMARY_DEFAULTS = {
+    "total_files": 0,
+    "total_size_human": "N/A",
+    "directories": 0,
+    "duplicate_groups": 0,
+    "duplicate_files": 0,
+    "wasted_space_human": "N/A",
+    "files_moved": 0,
+    "iphone_photos": 0,
+    "iphone_videos": 0,
+    "screenshots": 0,
+    "snapchat": 0,
+    "non_apple": 0,
+    "errors": 0,
+}
 
 
 class StatCard(QFrame):
@@ -56,6 +162,50 @@ class StatCard(QFrame):
 
     clicked = Signal(str)  # category key
 
+    # Stylesheets are built once; only the icon/hover sheets depend on the
+    # card color and are formatted per card in __init__
+    _CARD_CSS = """
+            StatCard {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #26262c, stop:1 #1f1f24);
+                border-radius: 14px;
+                border: 1px solid #32323a;
+                padding: 0px;
+                font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display";
+            }
+        """
+    _VALUE_CSS = """
+            QLabel {
+                font-size: 34px;
+                font-weight: 800;
+                color: #f7f7f7;
+            }
+        """
+    _TEXT_CSS = """
+            QLabel {
+                font-size: 13px;
+                color: #b8b8c7;
+                font-weight: 600;
+            }
+        """
+    _ICON_CSS = """
+            QLabel {{
+                font-size: {size}px;
+                color: {color};
+            }}
+        """
+    # Pre-rendered value strings for the counts cards show most of the time
+    _VALUE_TEXT = tuple(str(i) for i in range(1000))
+
+    _HOVER_CSS = """
+            StatCard {{
+                background-color: {bg};
+                border-radius: 12px;
+                border-left: 5px solid {color};
+                font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display";
+            }}
+        """
+
     def __init__(
         self,
         key: str,
@@ -72,9 +222,21 @@ class StatCard(QFrame):
         self.text_label = QLabel(label)
         self.icon_label = QLabel(icon)
         self._current_value = 0
+        self._shown_value = 0
         self._hover_anim: Optional[QPropertyAnimation] = None
         self._value_anim: Optional[QVariantAnimation] = None
 
+        self._icon_css_initial = self._ICON_CSS.format(size=26, color=border_color)
+        self._icon_css_active = self._ICON_CSS.format(size=28, color=border_color)
+        self._icon_css_zero = self._ICON_CSS.format(
+            size=28, color=f"{border_color}AA"
+        )
+        self._hover_css = {
+            entering: self._HOVER_CSS.format(bg=bg, color=border_color)
+            for entering, bg in ((True, "#323232"), (False, "#2a2a2a"))
+        }
+        self._icon_css: Optional[str] = None
+
         self._setup_ui()
         self.setToolTip(tooltip)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -88,68 +250,30 @@ class StatCard(QFrame):
         self.setGraphicsEffect(shadow)
 
     def _setup_ui(self):
-        self.setStyleSheet(
-            f"""
-            StatCard {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #26262c, stop:1 #1f1f24);
-                border-radius: 14px;
-                border: 1px solid #32323a;
-                padding: 0px;
-                font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display";
-            }}
-        """
-        )
+        self.setStyleSheet(self._CARD_CSS)
         self.setFixedHeight(110)
         self.setMinimumWidth(200)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
-        layout = QHBoxLayout(self)
+        # One grid: value/label stacked in column 0, icon spanning column 1
+        layout = QGridLayout(self)
         layout.setContentsMargins(18, 16, 18, 16)
-        layout.setSpacing(14)
+        layout.setHorizontalSpacing(14)
+        layout.setVerticalSpacing(6)
+        layout.setColumnStretch(0, 1)
 
-        # Left side: value and label
-        left_layout = QVBoxLayout()
-        left_layout.setSpacing(6)
+        self.value_label.setStyleSheet(self._VALUE_CSS)
+        self.text_label.setStyleSheet(self._TEXT_CSS)
 
-        self.value_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 34px;
-                font-weight: 800;
-                color: #f7f7f7;
-            }
-        """
-        )
-
-        self.text_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 13px;
-                color: #b8b8c7;
-                font-weight: 600;
-            }
-        """
-        )
-
-        left_layout.addWidget(self.value_label)
-        left_layout.addWidget(self.text_label)
+        layout.addWidget(self.value_label, 0, 0)
+        layout.addWidget(self.text_label, 1, 0)
 
         # Right side: icon
-        self.icon_label.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 26px;
-                color: {self.border_color};
-            }}
-        """
-        )
+        self._set_icon_css(self._icon_css_initial)
         self.icon_label.setAlignment(
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
         )
-
-        layout.addLayout(left_layout, 1)
-        layout.addWidget(self.icon_label)
+        layout.addWidget(self.icon_label, 0, 1, 2, 1)
 
     def enterEvent(self, event):
         self._animate_hover(entering=True)
@@ -160,36 +284,23 @@ class StatCard(QFrame):
         return super().leaveEvent(event)
 
     def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
+        if event.button() == _LEFT_BUTTON:
             self._animate_click()
             self.clicked.emit(self.key)
         return super().mousePressEvent(event)
 
     def _animate_hover(self, entering: bool) -> None:
         target = 1.02 if entering else 1.0
-        if (
-            self._hover_anim
-            and self._hover_anim.state() == QAbstractAnimation.State.Running
-        ):
+        if self._hover_anim and self._hover_anim.state() == _ANIM_RUNNING:
             self._hover_anim.stop()
         self._hover_anim = QPropertyAnimation(self, b"maximumHeight")
         self._hover_anim.setDuration(150)
         self._hover_anim.setStartValue(self.height())
         self._hover_anim.setEndValue(int(100 * target))
-        self._hover_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self._hover_anim.setEasingCurve(_EASE_OUT)
         self._hover_anim.start()
         # Background lift
-        bg = "#323232" if entering else "#2a2a2a"
-        self.setStyleSheet(
-            f"""
-            StatCard {{
-                background-color: {bg};
-                border-radius: 12px;
-                border-left: 5px solid {self.border_color};
-                font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display";
-            }}
-        """
-        )
+        self.setStyleSheet(self._hover_css[entering])
 
     def _animate_click(self) -> None:
         anim = QPropertyAnimation(self, b"maximumHeight")
@@ -197,25 +308,35 @@ class StatCard(QFrame):
         anim.setKeyValueAt(0, self.height())
         anim.setKeyValueAt(0.5, int(100 * 0.98))
         anim.setKeyValueAt(1, self.height())
-        anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        anim.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        anim.setEasingCurve(_EASE_IN_OUT)
+        anim.start(_DELETE_WHEN_STOPPED)
 
     def _animate_value_change(self, old: int, new: int) -> None:
-        if (
-            self._value_anim
-            and self._value_anim.state() == QAbstractAnimation.State.Running
-        ):
+        if self._value_anim and self._value_anim.state() == _ANIM_RUNNING:
             self._value_anim.stop()
         self._value_anim = QVariantAnimation(self)
         self._value_anim.setStartValue(old)
         self._value_anim.setEndValue(new)
         self._value_anim.setDuration(200)
-        self._value_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
-        self._value_anim.valueChanged.connect(
-            lambda v: self.value_label.setText(str(int(v)))
-        )
+        self._value_anim.setEasingCurve(_EASE_OUT)
+        self._value_anim.valueChanged.connect(self._show_value)
         self._value_anim.start()
 
+    def _show_value(self, value) -> None:
+        # Animation frames often repeat an integer; only re-render on change
+        value = int(value)
+        if value != self._shown_value:
+            self._shown_value = value
+            self.value_label.setText(
+                self._VALUE_TEXT[value] if 0 <= value < 1000 else str(value)
+            )
+
+    def _set_icon_css(self, css: str) -> None:
+        # Re-applying an identical sheet still re-parses it; skip that
+        if css is not self._icon_css:
+            self._icon_css = css
+            self.icon_label.setStyleSheet(css)
+
     def value(self) -> int:
         return self._current_value
 
@@ -224,55 +345,219 @@ class StatCard(QFrame):
         self._current_value = value
         if value == 0:
             self.setWindowOpacity(0.8)
-            self.icon_label.setStyleSheet(
-                f"""
-                QLabel {{
-                    font-size: 28px;
-                    color: {self.border_color}AA;
-                }}
-            """
-            )
+            self._set_icon_css(self._icon_css_zero)
         else:
             self.setWindowOpacity(1.0)
-            self.icon_label.setStyleSheet(
-                f"""
-                QLabel {{
-                    font-size: 28px;
-                    color: {self.border_color};
-                }}
-            """
-            )
+            self._set_icon_css(self._icon_css_active)
         self._animate_value_change(old, value)
 
 
 class UndoWorker(QThread):
     """Background worker for undo operations."""
 
+    # Emit progress after this many restored files or seconds, whichever
+    # comes first (and always for the last file)
+    PROGRESS_EVERY = 64
+    PROGRESS_SECONDS = 0.05
+
     progress = Signal(int, int)
     log_message = Signal(str)
     error_log = Signal(str, str, str)
     finished = Signal(UndoResult)
 
-    def __init__(self, manifest_path: Path, undoer: ManifestUndoer):
+    def __init__(
+        self,
+        manifest_path: Path,
+        undoer: ManifestUndoer,
+        total_count: Optional[int] = None,
+    ):
         super().__init__()
         self.manifest_path = manifest_path
         self.undoer = undoer
-        self._cancel_requested = False
+        # Exact move count if already known (saves the worker a counting pass)
+        self.total_count = total_count
+        self._cancel = threading.Event()
+        self._last_emit_count = 0
+        self._last_emit_time = 0.0
 
     def request_cancel(self):
-        self._cancel_requested = True
+        self._cancel.set()
+
+    def _on_progress(self, current: int, total: int) -> None:
+        # Called per file; only some calls cross to the GUI thread
+        now = time.monotonic()
+        if (
+            current >= total
+            or current - self._last_emit_count >= self.PROGRESS_EVERY
+            or now - self._last_emit_time >= self.PROGRESS_SECONDS
+        ):
+            self._last_emit_count = current
+            self._last_emit_time = now
+            self.progress.emit(current, total)
 
     def run(self):
+        self._last_emit_count = 0
+        self._last_emit_time = time.monotonic()
         result = self.undoer.undo_manifest(
             self.manifest_path,
-            progress_callback=lambda c, t: self.progress.emit(c, t),
-            log_callback=lambda m: self.log_message.emit(m),
-            error_log_callback=lambda c, f, e: self.error_log.emit(c, f, e),
-            should_cancel=lambda: self._cancel_requested,
+            progress_callback=self._on_progress,
+            log_callback=self.log_message.emit,
+            error_log_callback=self.error_log.emit,
+            should_cancel=self._cancel.is_set,
+            total_count=self.total_count,
         )
         self.finished.emit(result)
 
 
+def _manifest_count_entry(
+    path: Path, cached: Optional[Tuple[int, int, int]]
+) -> Tuple[int, int, int, bool]:
+    """
+    Return (mtime_ns, size, move count, exact) for a manifest.
+
+    A cached exact count is reused while the file is unchanged; otherwise
+    the count is estimated from a sample of the file.
+    """
+    st = path.stat()
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return (*cached, True)
+    count, exact = ManifestUndoer.estimate_moves(path)
+    return (st.st_mtime_ns, st.st_size, count, exact)
+
+
+def _manifest_fingerprint(path: Path, size: int) -> str:
+    """
+    Return a short hash identifying a manifest's contents.
+
+    Hashes the first MANIFEST_FINGERPRINT_BYTES of recorded moves plus
+    their total size. Leading "#" comment lines are skipped, since the text
+    header carries the run's own timestamp and would make copies differ.
+
+    Args:
+        path: Manifest file
+        size: File size in bytes
+
+    Raises:
+        OSError: If the manifest cannot be read
+    """
+    with open(path, "rb") as f:
+        head = f.read(MANIFEST_FINGERPRINT_BYTES)
+        offset = 0
+        while head.startswith(b"#", offset):
+            newline = head.find(b"\n", offset)
+            if newline < 0:
+                break
+            offset = newline + 1
+        if offset:
+            head = head[offset:] + f.read(offset)
+    digest = hashlib.blake2b(head, digest_size=8)
+    digest.update(str(size - offset).encode())
+    return digest.hexdigest()
+
+
+class ManifestCountWorker(QThread):
+    """Background worker that counts moves in manifests for the undo picker."""
+
+    # Cap on manifests counted concurrently (file reads release the GIL)
+    MAX_THREADS = 8
+
+    # One (mtime_ns, size, count, exact, fingerprint) entry per path,
+    # or None if unreadable
+    finished = Signal(list)
+
+    def __init__(self, paths: List[Path], cache: Dict[Path, Tuple[int, int, int]]):
+        super().__init__()
+        self.paths = list(paths)
+        # Snapshot: the GUI thread owns the live cache
+        self._cache = dict(cache)
+
+    def _count(self, path: Path) -> Optional[Tuple[int, int, int, bool, str]]:
+        try:
+            entry = _manifest_count_entry(path, self._cache.get(path))
+            return (*entry, _manifest_fingerprint(path, entry[1]))
+        except Exception:
+            return None
+
+    def run(self):
+        workers = max(1, min(self.MAX_THREADS, len(self.paths)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="isort-manifest-count"
+        ) as pool:
+            entries = list(pool.map(self._count, self.paths))
+        self.finished.emit(entries)
+
+
+def _iter_visible_path_batches(folder: bytes) -> Iterator[List[bytes]]:
+    """Iterate over non-hidden file paths as bytes, one list per directory."""
+    # Explicit scandir stack over bytes paths: file types come from the
+    # directory listing (no extra stat) and entry.path is prebuilt by
+    # scandir, so names are never decoded or re-joined here
+    stack = [folder]
+    while stack:
+        batch = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith(b"."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            batch.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            # Unreadable folder - os.walk skipped these silently too
+            continue
+        if batch:
+            yield batch
+
+
+def iter_visible_file_batches(folder: str) -> Iterator[List[str]]:
+    """Iterate over non-hidden files in folder tree, one list per directory."""
+    fsdecode = os.fsdecode
+    for batch in _iter_visible_path_batches(os.fsencode(folder)):
+        yield [fsdecode(path) for path in batch]
+
+
+def iter_visible_files(folder: str) -> Iterator[str]:
+    """Iterate over non-hidden files in folder tree."""
+    for batch in iter_visible_file_batches(folder):
+        yield from batch
+
+
+class ScanWorker(QThread):
+    """Background worker that counts files for the folder preview."""
+
+    # Emit a running count every this many files
+    PROGRESS_EVERY = 1000
+
+    progress = Signal(int)
+    finished = Signal(int)
+
+    def __init__(self, folder: str):
+        super().__init__()
+        self.folder = folder
+        self._cancel = threading.Event()
+
+    def request_cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        # Count whole bytes-path batches: no per-file decode or Python work
+        file_count = 0
+        next_progress = self.PROGRESS_EVERY
+        for batch in _iter_visible_path_batches(os.fsencode(self.folder)):
+            if self._cancel.is_set():
+                break
+            file_count += len(batch)
+            if file_count >= next_progress:
+                self.progress.emit(file_count)
+                next_progress = file_count + self.PROGRESS_EVERY
+        self.finished.emit(file_count)
+
+
 class MainWindow(QMainWindow):
     """Main application window for iSort file organizer."""
 
@@ -283,6 +568,69 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1050, 720)
 
         self.worker = None
+        # One undoer for the session; it only holds the manifest directory
+        self._undoer = ManifestUndoer()
+        # Manifest path -> (mtime_ns, size, move count), filled from
+        # ManifestCountWorker results and reused while files are unchanged
+        self._manifest_count_cache: Dict[Path, Tuple[int, int, int]] = {}
+        # (manifest dir mtime_ns, manifests) from the last listing; the
+        # directory mtime changes whenever a manifest is added or removed
+        self._manifest_list_cache: Optional[Tuple[int, List[ManifestInfo]]] = None
+        # Shared message box, created on first use by _show_message
+        self._message_box: Optional[QMessageBox] = None
+        self.scan_worker: Optional[ScanWorker] = None
+        self.manifest_count_worker: Optional[ManifestCountWorker] = None
+        self.undo_worker: Optional[UndoWorker] = None
+
+        # Latest worker progress (current, total) and processed file name,
+        # stored from the worker thread (direct connection, no per-file
+        # event) and applied every PROGRESS_FLUSH_MS
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        self._pending_status: Optional[str] = None
+        # (current, total) last applied to the progress widgets
+        self._shown_progress: Optional[Tuple[int, int]] = None
+        self._progress_lock = threading.Lock()
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Worker stats are merged here from the worker thread (direct
+        # connection, no per-emit event) and applied every STATS_FLUSH_MS
+        self._stats_buffer: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(STATS_FLUSH_MS)
+        self._stats_timer.timeout.connect(self._flush_stats)
+
+        # Active undo run: progress dialog, its error log, and the latest
+        # (current, total), applied at most every UNDO_PROGRESS_UPDATE_MS
+        # because setValue() on a modal dialog pumps events
+        self._undo_progress_dialog: Optional[QProgressDialog] = None
+        self._undo_error_logger: Optional[ErrorLogger] = None
+        self._undo_latest_progress = (0, 0)
+        self._undo_progress_timer = QTimer(self)
+        self._undo_progress_timer.setSingleShot(True)
+        self._undo_progress_timer.setInterval(UNDO_PROGRESS_UPDATE_MS)
+        self._undo_progress_timer.timeout.connect(self._flush_undo_progress)
+        self._undo_dialog_timer = QTimer(self)
+        self._undo_dialog_timer.setSingleShot(True)
+        self._undo_dialog_timer.setInterval(UNDO_DIALOG_MIN_DURATION_MS)
+        self._undo_dialog_timer.timeout.connect(self._show_undo_progress_dialog)
+        self._superseded_scans: List[ScanWorker] = []
+
+        # Statistics/Results tabs are built on first use (_ensure_tab_loaded);
+        # until then stats updates and the live counter are held here
+        self.stats_widget: Optional[StatsWidget] = None
+        self.results_viewer: Optional[QPlainTextEdit] = None
+        self._lazy_tabs: Dict[int, Callable[[], QWidget]] = {}
+        self._pending_tab_stats: Dict[str, int] = {}
+        self._stats_live_counter = None
+        # Summary text not yet shown; applied when the Results tab is opened
+        self._pending_results_text: Optional[str] = None
+        # Preview flag whose resume-checkbox state is currently applied
+        # (None: stale, e.g. the checkbox was disabled for a run)
+        self._applied_preview_mode: Optional[bool] = None
+
         self.stats = {
             "files_moved": 0,
             "iphone_photos": 0,
@@ -296,18 +644,24 @@ class MainWindow(QMainWindow):
         self._setup_ui()
         self._connect_signals()
 
+        # (stats key, card) pairs, built once for the stats update path
+        self._stat_cards = (
+            ("files_moved", self.card_files_moved),
+            ("iphone_photos", self.card_iphone_photos),
+            ("iphone_videos", self.card_iphone_videos),
+            ("screenshots", self.card_screenshots),
+            ("snapchat", self.card_snapchat),
+            ("non_apple", self.card_non_apple),
+            ("errors", self.card_errors),
+        )
+
     def _setup_ui(self) -> None:
         """Set up the main UI layout matching the mockups."""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        central_widget.setStyleSheet(
-            """
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #0f1014, stop:1 #0b0c10);
-            }
-        """
-        )
+        central_widget.setObjectName("central_widget")
+        # One stylesheet for the whole window, parsed once; see ui/styles.py
+        central_widget.setStyleSheet(MAIN_WINDOW_QSS)
 
         main_layout = QVBoxLayout(central_widget)
         main_layout.setSpacing(24)
@@ -319,13 +673,13 @@ class MainWindow(QMainWindow):
         # App icon and title
         title_layout = QHBoxLayout()
         app_icon = QLabel("💻")
-        app_icon.setStyleSheet("font-size: 36px; color: #4a9eff;")
+        app_icon.setObjectName("app_icon")
 
         title_text = QVBoxLayout()
         app_title = QLabel("iSort")
-        app_title.setStyleSheet("font-size: 28px; font-weight: bold; color: #ffffff;")
+        app_title.setObjectName("app_title")
         app_subtitle = QLabel("Apple Device File Organizer")
-        app_subtitle.setStyleSheet("font-size: 14px; color: #888888;")
+        app_subtitle.setObjectName("app_subtitle")
         title_text.addWidget(app_title)
         title_text.addWidget(app_subtitle)
         title_text.setSpacing(2)
@@ -338,9 +692,9 @@ class MainWindow(QMainWindow):
         version_layout = QVBoxLayout()
         version_layout.setAlignment(Qt.AlignmentFlag.AlignRight)
         version_label = QLabel("v10.0")
-        version_label.setStyleSheet("font-size: 14px; color: #888888;")
+        version_label.setObjectName("version_label")
         engine_label = QLabel("Confidence Scoring Engine")
-        engine_label.setStyleSheet("font-size: 12px; color: #666666;")
+        engine_label.setObjectName("engine_label")
         version_layout.addWidget(version_label, alignment=Qt.AlignmentFlag.AlignRight)
         version_layout.addWidget(engine_label, alignment=Qt.AlignmentFlag.AlignRight)
 
@@ -350,54 +704,22 @@ class MainWindow(QMainWindow):
 
         # === Source Folder Section ===
         source_frame = QFrame()
-        source_frame.setStyleSheet(
-            """
-            QFrame {
-                background: #1f2025;
-                border-radius: 12px;
-                border: 1px solid #2f3038;
-            }
-        """
-        )
+        source_frame.setObjectName("source_frame")
         source_layout = QVBoxLayout(source_frame)
         source_layout.setContentsMargins(16, 12, 16, 12)
 
         source_title = QLabel("Source Folder")
-        source_title.setStyleSheet(
-            "font-size: 13px; color: #888888; font-weight: bold;"
-        )
+        source_title.setObjectName("source_title")
 
         folder_row = QHBoxLayout()
         folder_icon = QLabel("📁")
-        folder_icon.setStyleSheet("font-size: 18px;")
+        folder_icon.setObjectName("folder_icon")
 
         self.source_path = QLabel("No folder selected")
-        self.source_path.setStyleSheet(
-            """
-            QLabel {
-                font-size: 14px;
-                color: #888888;
-                font-family: 'SF Mono', 'Menlo', monospace;
-            }
-        """
-        )
+        self.source_path.setObjectName("source_path")
 
         self.browse_btn = QPushButton("Browse...")
-        self.browse_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """
-        )
+        self.browse_btn.setObjectName("browse_btn")
 
         folder_row.addWidget(folder_icon)
         folder_row.addWidget(self.source_path, 1)
@@ -409,22 +731,12 @@ class MainWindow(QMainWindow):
 
         # === Options Section ===
         options_frame = QFrame()
-        options_frame.setStyleSheet(
-            """
-            QFrame {
-                background: #1f2025;
-                border-radius: 12px;
-                border: 1px solid #2f3038;
-            }
-        """
-        )
+        options_frame.setObjectName("options_frame")
         options_layout = QVBoxLayout(options_frame)
         options_layout.setContentsMargins(16, 12, 16, 12)
 
         options_title = QLabel("Options")
-        options_title.setStyleSheet(
-            "font-size: 13px; color: #888888; font-weight: bold;"
-        )
+        options_title.setObjectName("options_title")
 
         options_row = QHBoxLayout()
         options_row.setSpacing(24)
@@ -432,76 +744,19 @@ class MainWindow(QMainWindow):
         # Mode selector
         mode_layout = QHBoxLayout()
         mode_label = QLabel("Mode:")
-        mode_label.setStyleSheet("font-size: 14px; color: #ffffff;")
+        mode_label.setObjectName("mode_label")
 
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(
-            [
-                "Organize Files",
-                "Preview Only (Dry Run)",
-                "Generate Inventory",
-                "Find Duplicates",
-            ]
-        )
-        self.mode_combo.setStyleSheet(
-            """
-            QComboBox {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 13px;
-                min-width: 160px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 8px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #888888;
-                margin-right: 8px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                selection-background-color: #4a9eff;
-            }
-        """
-        )
+        self.mode_combo.addItems(UI_MODES)
+        self.mode_combo.setObjectName("mode_combo")
 
         mode_layout.addWidget(mode_label)
         mode_layout.addWidget(self.mode_combo)
 
-        # Checkboxes
+        # Checkboxes (styled by the "#options_frame QCheckBox" rules)
         self.verify_hash_cb = QCheckBox("Verify hashes after move")
         self.verify_hash_cb.setChecked(True)
-        self.verify_hash_cb.setStyleSheet(
-            """
-            QCheckBox {
-                font-size: 14px;
-                color: #ffffff;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 9px;
-                border: 2px solid #555555;
-                background-color: #2d2d2d;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4a9eff;
-                border-color: #4a9eff;
-            }
-        """
-        )
-
         self.resume_cb = QCheckBox("Resume from checkpoint")
-        self.resume_cb.setStyleSheet(self.verify_hash_cb.styleSheet())
 
         options_row.addLayout(mode_layout)
         options_row.addWidget(self.verify_hash_cb)
@@ -514,26 +769,16 @@ class MainWindow(QMainWindow):
 
         # === Progress Section ===
         progress_frame = QFrame()
-        progress_frame.setStyleSheet(
-            """
-            QFrame {
-                background: #1f2025;
-                border-radius: 12px;
-                border: 1px solid #2f3038;
-            }
-        """
-        )
+        progress_frame.setObjectName("progress_frame")
         progress_layout = QVBoxLayout(progress_frame)
         progress_layout.setContentsMargins(16, 12, 16, 12)
 
         progress_header = QHBoxLayout()
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("font-size: 14px; color: #ffffff;")
+        self.status_label.setObjectName("status_label")
 
         self.progress_text = QLabel("0 / 100")
-        self.progress_text.setStyleSheet(
-            "font-size: 14px; color: #888888; font-family: 'SF Mono', monospace;"
-        )
+        self.progress_text.setObjectName("progress_text")
 
         progress_header.addWidget(self.status_label)
         progress_header.addStretch()
@@ -541,23 +786,7 @@ class MainWindow(QMainWindow):
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet(
-            """
-            QProgressBar {
-                border: none;
-                border-radius: 6px;
-                background-color: #3d3d3d;
-                height: 12px;
-            }
-            QProgressBar::chunk {
-                border-radius: 6px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4a9eff, stop:1 #7c3aed
-                );
-            }
-        """
-        )
+        self.progress_bar.setObjectName("progress_bar")
 
         progress_layout.addLayout(progress_header)
         progress_layout.addWidget(self.progress_bar)
@@ -647,70 +876,23 @@ class MainWindow(QMainWindow):
 
         # === Tabbed View ===
         tab_frame = QFrame()
-        tab_frame.setStyleSheet(
-            """
-            QFrame {
-                background-color: #2d2d2d;
-                border-radius: 12px;
-            }
-        """
-        )
+        tab_frame.setObjectName("tab_frame")
         tab_layout = QVBoxLayout(tab_frame)
         tab_layout.setContentsMargins(0, 0, 0, 0)
 
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet(
-            """
-            QTabWidget::pane {
-                border: none;
-                background-color: #2d2d2d;
-                border-radius: 12px;
-            }
-            QTabBar::tab {
-                background-color: transparent;
-                color: #888888;
-                padding: 10px 20px;
-                font-size: 14px;
-                border: none;
-                margin-right: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4a9eff;
-                color: #ffffff;
-                border-radius: 8px;
-            }
-            QTabBar::tab:hover:!selected {
-                color: #ffffff;
-            }
-        """
-        )
+        self.tab_widget.setObjectName("tab_widget")
 
         # Log tab
         self.log_viewer = LogViewer()
         self.tab_widget.addTab(self.log_viewer, "📋 Log")
 
-        # Statistics tab
-        self.stats_widget = StatsWidget()
-        self.tab_widget.addTab(self.stats_widget, "📊 Statistics")
-
-        # Results tab
-        self.results_viewer = QTextEdit()
-        self.results_viewer.setReadOnly(True)
-        self.results_viewer.setPlaceholderText("No logs yet...")
-        self.results_viewer.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #1a1a1a;
-                color: #888888;
-                border: none;
-                border-radius: 8px;
-                padding: 16px;
-                font-family: 'SF Mono', 'Menlo', monospace;
-                font-size: 14px;
-            }
-        """
-        )
-        self.tab_widget.addTab(self.results_viewer, "📁 Results")
+        # Statistics and Results tabs: empty placeholders until first shown
+        stats_index = self.tab_widget.addTab(QWidget(), "📊 Statistics")
+        self._lazy_tabs[stats_index] = self._create_stats_tab
+        self._results_tab_index = self.tab_widget.addTab(QWidget(), _RESULTS_TAB_LABEL)
+        self._lazy_tabs[self._results_tab_index] = self._create_results_tab
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         tab_layout.addWidget(self.tab_widget)
         main_layout.addWidget(tab_frame, 1)
@@ -720,65 +902,14 @@ class MainWindow(QMainWindow):
         button_layout.addStretch()
 
         self.undo_btn = QPushButton("↻  Undo Last Run")
-        self.undo_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: transparent;
-                color: #ef4444;
-                border: 2px solid #ef4444;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(239, 68, 68, 0.1);
-            }
-        """
-        )
+        self.undo_btn.setObjectName("undo_btn")
 
         self.start_btn = QPushButton("▶  Start")
-        self.start_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #22c55e;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 32px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #16a34a;
-            }
-            QPushButton:disabled {
-                background-color: #4a4a4a;
-            }
-        """
-        )
+        self.start_btn.setObjectName("start_btn")
 
         self.stop_btn = QPushButton("⏹  Stop")
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #ef4444;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 32px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #dc2626;
-            }
-            QPushButton:disabled {
-                background-color: #4a4a4a;
-            }
-        """
-        )
+        self.stop_btn.setObjectName("stop_btn")
         self.stop_btn.hide()
 
         button_layout.addWidget(self.undo_btn)
@@ -787,6 +918,103 @@ class MainWindow(QMainWindow):
 
         main_layout.addLayout(button_layout)
 
+    def _show_message(
+        self,
+        icon: QMessageBox.Icon,
+        title: str,
+        text: str,
+        buttons: QMessageBox.StandardButton = QMessageBox.StandardButton.Ok,
+        default: QMessageBox.StandardButton = QMessageBox.StandardButton.NoButton,
+    ) -> QMessageBox.StandardButton:
+        """
+        Show a modal message box, reusing one instance across calls.
+
+        Args:
+            icon: Message icon (warning, information, question)
+            title: Window title
+            text: Message text
+            buttons: Standard buttons to offer
+            default: Default button (NoButton lets Qt choose)
+
+        Returns:
+            The standard button the user clicked
+        """
+        box = self._message_box
+        if box is None:
+            box = self._message_box = QMessageBox(self)
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        box.setDefaultButton(default)
+        return QMessageBox.StandardButton(box.exec())
+
+    def _create_stats_tab(self) -> QWidget:
+        """Build the Statistics tab, applying stats received before it existed."""
+        self.stats_widget = StatsWidget()
+        if self._pending_tab_stats:
+            self.stats_widget.update_stats(self._pending_tab_stats)
+            self._pending_tab_stats = {}
+        if self._stats_live_counter is not None:
+            self.stats_widget.bind_live_counter(self._stats_live_counter)
+        return self.stats_widget
+
+    def _create_results_tab(self) -> QWidget:
+        """Build the Results tab."""
+        # Plain-text view: the summary is fixed-width text, no rich-text layout
+        self.results_viewer = QPlainTextEdit()
+        self.results_viewer.setReadOnly(True)
+        self.results_viewer.setPlaceholderText("No logs yet...")
+        self.results_viewer.setObjectName("results_viewer")
+        return self.results_viewer
+
+    @Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """Build the tab on first activation and apply a waiting results summary."""
+        self._ensure_tab_loaded(index)
+        if index == self._results_tab_index:
+            self._apply_pending_results()
+
+    def _apply_pending_results(self) -> None:
+        """Show the waiting results summary and clear the tab's unseen marker."""
+        viewer = self.results_viewer
+        if viewer is None or self._pending_results_text is None:
+            return
+        text, self._pending_results_text = self._pending_results_text, None
+        viewer.setPlainText(text)
+        self.tab_widget.setTabText(self._results_tab_index, _RESULTS_TAB_LABEL)
+
+    def _ensure_tab_loaded(self, index: int) -> None:
+        """Replace a placeholder tab with its real widget on first activation."""
+        factory = self._lazy_tabs.pop(index, None)
+        if factory is None:
+            return
+        tabs = self.tab_widget
+        placeholder = tabs.widget(index)
+        label = tabs.tabText(index)
+        current = tabs.currentIndex()
+        # Swapping the page would otherwise re-enter this slot
+        tabs.blockSignals(True)
+        tabs.removeTab(index)
+        tabs.insertTab(index, factory(), label)
+        tabs.setCurrentIndex(current)
+        tabs.blockSignals(False)
+        if placeholder is not None:
+            placeholder.deleteLater()
+
+    def _update_stats_tab(self, stats: Dict[str, int]) -> None:
+        """Update the Statistics tab, or hold the stats until it is built."""
+        if self.stats_widget is None:
+            self._pending_tab_stats.update(stats)
+        else:
+            self.stats_widget.update_stats(stats)
+
+    def _bind_stats_live_counter(self, counter) -> None:
+        """Bind (or with None, unbind) the Statistics tab's live counter."""
+        self._stats_live_counter = counter
+        if self.stats_widget is not None:
+            self.stats_widget.bind_live_counter(counter)
+
     def _connect_signals(self) -> None:
         """Connect widget signals to slots."""
         self.browse_btn.clicked.connect(self._browse_folder)
@@ -806,41 +1034,63 @@ class MainWindow(QMainWindow):
 
         if folder:
             self.source_path.setText(folder)
-            self.source_path.setStyleSheet(
-                """
-                QLabel {
-                    font-size: 14px;
-                    color: #ffffff;
-                    font-family: 'SF Mono', 'Menlo', monospace;
-                }
-            """
-            )
+            # Switch to the highlighted #source_path[selected="true"] rule
+            self.source_path.setProperty("selected", True)
+            self.source_path.style().unpolish(self.source_path)
+            self.source_path.style().polish(self.source_path)
             self.log_viewer.log(f"Selected folder: {folder}", "info")
             self._scan_folder_preview(folder)
 
     def _scan_folder_preview(self, folder: str) -> None:
-        """Scan folder and update preview information."""
-        file_count = 0
-        for _ in self._iter_files(folder):
-            file_count += 1
+        """Count files in the background and update preview information."""
+        if self.scan_worker is not None:
+            # Superseded by a new selection; keep it alive until it exits
+            self.scan_worker.request_cancel()
+            self._superseded_scans.append(self.scan_worker)
+
+        self.start_btn.setEnabled(False)
+        self.progress_text.setText("Scanning...")
+        # Busy indicator until the total is known
+        self.progress_bar.setRange(0, 0)
+
+        self.scan_worker = ScanWorker(folder)
+        self.scan_worker.progress.connect(self._on_scan_progress)
+        self.scan_worker.finished.connect(self._on_scan_finished)
+        self.scan_worker.start()
+
+    @Slot(int)
+    def _on_scan_progress(self, file_count: int) -> None:
+        """Show the running file count while the preview scan is active."""
+        if self.sender() is not self.scan_worker:
+            return
+        self.progress_text.setText(f"Scanning... {file_count:,} files")
+
+    @Slot(int)
+    def _on_scan_finished(self, file_count: int) -> None:
+        """Apply the preview scan result."""
+        worker = cast(ScanWorker, self.sender())
+        # run() is returning; wait so the QThread is never dropped while running
+        worker.wait()
+        if worker is not self.scan_worker:
+            if worker in self._superseded_scans:
+                self._superseded_scans.remove(worker)
+            return
+        self.scan_worker = None
 
-        self.progress_bar.setMaximum(file_count)
+        self.progress_bar.setRange(0, file_count)
         self.progress_bar.setValue(0)
         self.progress_text.setText(f"0 / {file_count}")
         self.log_viewer.log(f"Found {file_count:,} files to process", "info")
-
-    def _iter_files(self, folder: str):
-        """Iterate over non-hidden files in folder tree."""
-        for root, dirs, files in os.walk(folder):
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
-            for filename in files:
-                if not filename.startswith("."):
-                    yield os.path.join(root, filename)
+        if self.worker is None or not self.worker.isRunning():
+            self.start_btn.setEnabled(True)
 
     @Slot(str)
     def _on_mode_changed(self, mode_text: str) -> None:
         """Handle mode selection changes."""
-        is_preview = mode_text == "Preview Only (Dry Run)"
+        is_preview = mode_text == MODE_PREVIEW
+        if is_preview == self._applied_preview_mode:
+            return
+        self._applied_preview_mode = is_preview
         if is_preview:
             self.resume_cb.setChecked(False)
             self.resume_cb.setEnabled(False)
@@ -862,16 +1112,14 @@ class MainWindow(QMainWindow):
             self._on_mode_changed(self.mode_combo.currentText())
         else:
             self.resume_cb.setEnabled(False)
+            self._applied_preview_mode = None
 
     def _update_stats_cards(self, stats: dict) -> None:
-        """Update all stat cards with current values."""
-        self.card_files_moved.set_value(stats.get("files_moved", 0))
-        self.card_iphone_photos.set_value(stats.get("iphone_photos", 0))
-        self.card_iphone_videos.set_value(stats.get("iphone_videos", 0))
-        self.card_screenshots.set_value(stats.get("screenshots", 0))
-        self.card_snapchat.set_value(stats.get("snapchat", 0))
-        self.card_non_apple.set_value(stats.get("non_apple", 0))
-        self.card_errors.set_value(stats.get("errors", 0))
+        """Update stat cards whose values changed."""
+        for key, card in self._stat_cards:
+            value = stats.get(key, 0)
+            if value != card.value():
+                card.set_value(value)
 
     @Slot(str)
     def _on_card_clicked(self, category: str) -> None:
@@ -881,41 +1129,43 @@ class MainWindow(QMainWindow):
             self.status_label.setText("Showing errors in Log")
             return
 
-        count_lookup = {
-            "files_moved": self.card_files_moved.value(),
-            "iphone_photos": self.card_iphone_photos.value(),
-            "iphone_videos": self.card_iphone_videos.value(),
-            "screenshots": self.card_screenshots.value(),
-            "snapchat": self.card_snapchat.value(),
-            "non_apple": self.card_non_apple.value(),
-            "errors": self.card_errors.value(),
-        }
+        count_lookup = {key: card.value() for key, card in self._stat_cards}
         dialog = StatsDetailDialog(category, count_lookup.get(category, 0), self)
         dialog.exec()
 
     @Slot()
     def _start_processing(self) -> None:
         """Start the file processing operation."""
+        # Imported on first use: the core engine (hashing, metadata, routing)
+        # is not needed to show the window, so keep it off the startup path
+        from isort_app.core.organizer import check_disk_space, MIN_DISK_SPACE_MB
+        from isort_app.core.worker import OrganizeWorker
+
         folder = self.source_path.text()
 
         if not folder or folder == "No folder selected":
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "No Folder Selected",
                 "Please select a source folder to process.",
             )
             return
 
         if not os.path.exists(folder):
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Invalid Folder",
                 "The selected folder does not exist.",
             )
             return
 
-        mode = self.mode_combo.currentText()
-        dry_run = mode == "Preview Only (Dry Run)"
+        # Read widget state once; reused below and passed to the worker
+        # Same order as the combo: yields the shared constant, so the mode
+        # checks below and in the worker compare by identity first
+        mode = UI_MODES[self.mode_combo.currentIndex()]
+        verify_hash = self.verify_hash_cb.isChecked()
+        resume = self.resume_cb.isChecked()
+        dry_run = mode == MODE_PREVIEW
 
         self._toggle_controls(processing=True)
         self.status_label.setText("Processing...")
@@ -923,15 +1173,19 @@ class MainWindow(QMainWindow):
         # Reset stats
         self.stats = {k: 0 for k in self.stats}
         self._update_stats_cards(self.stats)
+        # Worker updates carry only changed counters, so zero the Statistics
+        # tab too; otherwise untouched cards keep the previous run's values
+        self._pending_tab_stats.clear()
+        self._update_stats_tab(self.stats)
 
         # Check for checkpoint
-        if self.resume_cb.isChecked():
+        if resume:
             checkpoint_mgr = CheckpointManager()
             if checkpoint_mgr.exists():
                 _, _, _, is_invalid = checkpoint_mgr.load()
                 if is_invalid:
-                    QMessageBox.information(
-                        self,
+                    self._show_message(
+                        QMessageBox.Icon.Information,
                         "Invalid Checkpoint",
                         "The existing checkpoint file is corrupted.\n\n"
                         "Processing will start from the beginning.",
@@ -939,19 +1193,19 @@ class MainWindow(QMainWindow):
                     checkpoint_mgr.clear()
 
         # Check disk space
-        if mode == "Organize Files":
+        if mode == MODE_ORGANIZE:
             is_sufficient, available_mb = check_disk_space(Path(folder))
             if not is_sufficient:
-                reply = QMessageBox.warning(
-                    self,
+                reply = self._show_message(
+                    QMessageBox.Icon.Warning,
                     "Low Disk Space",
                     f"Low disk space detected: {available_mb} MB available.\n\n"
                     f"Minimum recommended: {MIN_DISK_SPACE_MB} MB.\n\n"
                     "Continue anyway?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No,
+                    _YES_NO,
+                    _NO,
                 )
-                if reply != QMessageBox.StandardButton.Yes:
+                if reply != _YES:
                     self._toggle_controls(processing=False)
                     self.status_label.setText("Ready")
                     return
@@ -962,19 +1216,31 @@ class MainWindow(QMainWindow):
         # Create worker
         self.worker = OrganizeWorker(
             folder=folder,
-            mode=self.mode_combo.currentText(),
-            verify_hash=self.verify_hash_cb.isChecked(),
+            mode=mode,
+            verify_hash=verify_hash,
             dry_run=dry_run,
-            resume=self.resume_cb.isChecked(),
+            resume=resume,
         )
 
         # Connect signals
-        self.worker.progress.connect(self._on_progress)
+        # Run in the worker thread: the _buffer_* slots only touch buffers
+        direct = Qt.ConnectionType.DirectConnection
+        self.worker.progress.connect(self._buffer_progress, direct)
         self.worker.log_message.connect(self._on_log)
-        self.worker.file_processed.connect(self._on_file_processed)
-        self.worker.stats_updated.connect(self._on_stats_updated)
+        self.worker.log_batch.connect(self._on_log_batch)
+        self.worker.file_processed.connect(self._buffer_file_processed, direct)
+        self.worker.stats_updated.connect(self._buffer_stats, direct)
         self.worker.finished.connect(self._on_finished)
 
+        self._bind_stats_live_counter(self.worker.live_counter)
+        with self._progress_lock:
+            self._pending_progress = None
+            self._pending_status = None
+        self._shown_progress = None
+        self._progress_timer.start()
+        with self._stats_lock:
+            self._stats_buffer.clear()
+        self._stats_timer.start()
         self.worker.start()
 
     @Slot()
@@ -984,46 +1250,102 @@ class MainWindow(QMainWindow):
             self.worker.request_stop()
             self.log_viewer.log("Stop requested, finishing current file...", "warning")
 
-    @Slot(int, int, str)
-    def _on_progress(self, current: int, total: int, eta: str) -> None:
-        """Handle progress updates from worker."""
-        self.progress_bar.setMaximum(total)
-        self.progress_bar.setValue(current)
-        self.progress_text.setText(f"{current} / {total}")
+    def _buffer_progress(self, current: int, total: int, eta: str) -> None:
+        """
+        Record the latest worker progress for the next _flush_progress.
+
+        Called directly in the worker thread, so it must not touch widgets.
+        """
+        with self._progress_lock:
+            self._pending_progress = (current, total)
+
+    def _buffer_file_processed(
+        self, filename: str, destination: str, status: str
+    ) -> None:
+        """
+        Record the latest processed file for the next _flush_progress.
+
+        Called directly in the worker thread, so it must not touch widgets.
+        """
+        with self._progress_lock:
+            self._pending_status = filename
+
+    @Slot()
+    def _flush_progress(self) -> None:
+        """Apply the latest buffered progress and processed file name."""
+        with self._progress_lock:
+            progress, self._pending_progress = self._pending_progress, None
+            status, self._pending_status = self._pending_status, None
+
+        if progress is not None:
+            current, total = progress
+            if progress != self._shown_progress:
+                self._shown_progress = progress
+                if self.progress_bar.maximum() != total:
+                    self.progress_bar.setMaximum(total)
+                self.progress_bar.setValue(current)
+                self.progress_text.setText(f"{current} / {total}")
+        if status is not None:
+            self.status_label.setText(f"Processing: {status}")
 
     @Slot(str, str)
     def _on_log(self, message: str, level: str) -> None:
         """Handle log messages from worker."""
         self.log_viewer.log(message, level)
 
-    @Slot(str, str, str)
-    def _on_file_processed(self, filename: str, destination: str, status: str) -> None:
-        """Handle file processed notifications from worker."""
-        self.status_label.setText(f"Processing: {filename}")
+    @Slot(list)
+    def _on_log_batch(self, batch: list) -> None:
+        """Handle a batch of (message, level) log lines from worker."""
+        self.log_viewer.log_many(batch)
 
-    @Slot(dict)
-    def _on_stats_updated(self, stats: dict) -> None:
-        """Handle stats updates from worker."""
+    def _buffer_stats(self, stats: dict) -> None:
+        """
+        Merge a worker stats update into the pending buffer.
+
+        Called directly in the worker thread, so it must not touch widgets;
+        _flush_stats applies the buffer on the GUI thread.
+        """
+        with self._stats_lock:
+            self._stats_buffer.update(stats)
+
+    @Slot()
+    def _flush_stats(self) -> None:
+        """Apply buffered worker stats to the cards and Statistics tab."""
+        with self._stats_lock:
+            if not self._stats_buffer:
+                return
+            stats, self._stats_buffer = self._stats_buffer, {}
         self.stats.update(stats)
         self._update_stats_cards(self.stats)
-        self.stats_widget.update_stats(stats)
+        self._update_stats_tab(stats)
 
     @Slot(dict)
     def _on_finished(self, stats: dict) -> None:
         """Handle processing completion."""
+        self._bind_stats_live_counter(None)
         self._toggle_controls(processing=False)
+        # Show the final progress, but drop any pending "Processing: ..."
+        # update so it can't overwrite the status below
+        self._progress_timer.stop()
+        with self._progress_lock:
+            self._pending_status = None
+        self._flush_progress()
+        # Final stats below supersede anything still buffered
+        self._stats_timer.stop()
+        with self._stats_lock:
+            self._stats_buffer.clear()
         self.status_label.setText("Ready")
 
         self._update_stats_cards(stats)
-        self.stats_widget.update_stats(stats)
+        self._update_stats_tab(stats)
 
         stopped_by_user = stats.get("stopped_by_user", False)
         error_count = stats.get("errors", 0)
 
         if stopped_by_user:
             self.log_viewer.log("Processing cancelled by user", "warning")
-            QMessageBox.information(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Information,
                 "Processing Cancelled",
                 f"Processing was cancelled by user.\n\n"
                 f"Files processed: {stats.get('files_moved', 0)}\n\n"
@@ -1033,8 +1355,8 @@ class MainWindow(QMainWindow):
             self.log_viewer.log(
                 f"Processing complete with {error_count} error(s)", "warning"
             )
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Processing Complete with Errors",
                 f"Processing completed with {error_count} error(s).\n\n"
                 "Check the Log tab for details.",
@@ -1049,68 +1371,142 @@ class MainWindow(QMainWindow):
         mode = stats.get("mode", "")
         stopped_by_user = stats.get("stopped_by_user", False)
 
-        if mode == "Generate Inventory":
-            summary = [
-                "╔════════════════════════════════════════════════════════════╗",
-                "║                   INVENTORY COMPLETE                       ║",
-                "╠════════════════════════════════════════════════════════════╣",
-                f"║  Total Files:        {stats.get('total_files', 0):<38}║",
-                f"║  Total Size:         {stats.get('total_size_human', 'N/A'):<38}║",
-                f"║  Directories:        {stats.get('directories', 0):<38}║",
-                f"║  Errors:             {stats.get('errors', 0):<38}║",
-                "╚════════════════════════════════════════════════════════════╝",
-            ]
-        elif mode == "Find Duplicates":
-            summary = [
-                "╔════════════════════════════════════════════════════════════╗",
-                "║                 DUPLICATE DETECTION COMPLETE               ║",
-                "╠════════════════════════════════════════════════════════════╣",
-                f"║  Files Scanned:      {stats.get('total_files', 0):<38}║",
-                f"║  Duplicate Groups:   {stats.get('duplicate_groups', 0):<38}║",
-                f"║  Duplicate Files:    {stats.get('duplicate_files', 0):<38}║",
-                f"║  Wasted Space:       {stats.get('wasted_space_human', 'N/A'):<38}║",
-                "╚════════════════════════════════════════════════════════════╝",
-            ]
+        if mode == MODE_INVENTORY:
+            template = _INVENTORY_SUMMARY
+        elif mode == MODE_DUPLICATES:
+            template = _DUPLICATES_SUMMARY
         else:
-            header = (
-                "PROCESSING CANCELLED" if stopped_by_user else "PROCESSING COMPLETE"
+            template = _ORGANIZE_SUMMARY
+
+        values = dict(_SUMMARY_DEFAULTS)
+        values.update(stats)
+        values["header"] = (
+            "PROCESSING CANCELLED" if stopped_by_user else "PROCESSING COMPLETE"
+        )
+
+        # Laid out only when the Results tab is opened; until then the tab
+        # label is marked so the user knows a new summary is waiting
+        self._pending_results_text = template.format_map(values)
+        if self.tab_widget.currentIndex() == self._results_tab_index:
+            self._apply_pending_results()
+        else:
+            self.tab_widget.setTabText(
+                self._results_tab_index, _RESULTS_TAB_UNSEEN_LABEL
             )
-            summary = [
-                "╔════════════════════════════════════════════════════════════╗",
-                f"║{header:^60}║",
-                "╠════════════════════════════════════════════════════════════╣",
-                f"║  Files Moved:        {stats.get('files_moved', 0):<38}║",
-                f"║  iPhone Photos:      {stats.get('iphone_photos', 0):<38}║",
-                f"║  iPhone Videos:      {stats.get('iphone_videos', 0):<38}║",
-                f"║  Screenshots:        {stats.get('screenshots', 0):<38}║",
-                f"║  Snapchat:           {stats.get('snapchat', 0):<38}║",
-                f"║  Non-Apple:          {stats.get('non_apple', 0):<38}║",
-                f"║  Errors:             {stats.get('errors', 0):<38}║",
-                "╚════════════════════════════════════════════════════════════╝",
-            ]
-
-        self.results_viewer.setText("\n".join(summary))
-        self.tab_widget.setCurrentWidget(self.results_viewer)
 
     @Slot()
     def _undo_last_run(self) -> None:
         """Undo the last processing run using manifest."""
-        undoer = ManifestUndoer()
-        manifests = undoer.list_manifests()
+        undoer = self._undoer
+        manifests = self._list_manifests()
 
         if not manifests:
-            QMessageBox.information(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Information,
                 "No Manifests Found",
                 "No manifest files found on Desktop.\n\n"
                 "Manifests are created when you run 'Organize Files' mode.",
             )
             return
 
-        manifest_items = [
-            f"{m.formatted_date} ({self._count_manifest_lines(m.path)} files)"
-            for m in manifests
-        ]
+        # Count off the GUI thread; the picker opens when counts are ready
+        self.undo_btn.setEnabled(False)
+        self.status_label.setText("Reading manifests...")
+        worker = ManifestCountWorker(
+            [m.path for m in manifests], self._manifest_count_cache
+        )
+
+        def on_counted(entries: list) -> None:
+            # run() is returning; wait so the QThread is never dropped while running
+            worker.wait()
+            self.manifest_count_worker = None
+
+            counts = []
+            fingerprints: List[Optional[str]] = []
+            for m, entry in zip(manifests, entries):
+                if entry is None:
+                    self._manifest_count_cache.pop(m.path, None)
+                    counts.append((0, True))
+                    fingerprints.append(None)
+                    continue
+                mtime_ns, size, count, exact, fingerprint = entry
+                if exact:
+                    self._manifest_count_cache[m.path] = (mtime_ns, size, count)
+                counts.append((count, exact))
+                fingerprints.append(fingerprint)
+
+            if self.worker is not None and self.worker.isRunning():
+                # A run was started meanwhile; it owns the controls now
+                return
+            self.status_label.setText("Ready")
+            self.undo_btn.setEnabled(True)
+            self._choose_and_undo(undoer, manifests, counts, fingerprints)
+
+        self.manifest_count_worker = worker
+        worker.finished.connect(on_counted)
+        worker.start()
+
+    def _count_manifest_exactly(self, path: Path) -> int:
+        """Count moves in one manifest and cache the exact result."""
+        try:
+            st = path.stat()
+            count = ManifestUndoer.count_moves(path)
+        except OSError:
+            return 0
+        self._manifest_count_cache[path] = (st.st_mtime_ns, st.st_size, count)
+        return count
+
+    def _list_manifests(self) -> List[ManifestInfo]:
+        """List manifests, reusing the last listing while the directory is unchanged."""
+        undoer = self._undoer
+        try:
+            dir_mtime = os.stat(undoer.manifest_dir).st_mtime_ns
+        except OSError:
+            # Let list_manifests() report the problem
+            self._manifest_list_cache = None
+            return undoer.list_manifests()
+
+        cached = self._manifest_list_cache
+        if cached is None or cached[0] != dir_mtime:
+            cached = self._manifest_list_cache = (dir_mtime, undoer.list_manifests())
+        return list(cached[1])
+
+    def _choose_and_undo(
+        self,
+        undoer: ManifestUndoer,
+        manifests: List[ManifestInfo],
+        counts: List[Tuple[int, bool]],
+        fingerprints: List[Optional[str]],
+        show_all: bool = False,
+    ) -> None:
+        """
+        Let the user pick a manifest, confirm, and start undoing it.
+
+        Args:
+            undoer: Undoer that listed the manifests
+            manifests: Manifests to offer, newest first
+            counts: (move count, exact) per manifest; estimates show as "~N"
+            fingerprints: Content fingerprint per manifest (None if unreadable)
+            show_all: Also list manifests whose contents duplicate a newer one
+        """
+        # Label -> (manifest, count, exact); first manifest wins on duplicates
+        items: Dict[str, Tuple[ManifestInfo, int, bool]] = {}
+        seen_fingerprints = set()
+        hidden = 0
+        for m, (count, exact), fingerprint in zip(manifests, counts, fingerprints):
+            if fingerprint is not None and not show_all:
+                # Newest first: later copies of the same contents are hidden
+                if fingerprint in seen_fingerprints:
+                    hidden += 1
+                    continue
+                seen_fingerprints.add(fingerprint)
+            approx = "" if exact else "~"
+            label = f"{m.formatted_date} ({approx}{count} files)"
+            items.setdefault(label, (m, count, exact))
+        manifest_items = list(items)
+        show_all_label = f"Show all manifests ({hidden} duplicates hidden)..."
+        if hidden:
+            manifest_items.append(show_all_label)
 
         selected, ok = QInputDialog.getItem(
             self,
@@ -1123,103 +1519,152 @@ class MainWindow(QMainWindow):
 
         if not ok or not selected:
             return
+        if hidden and selected == show_all_label:
+            self._choose_and_undo(
+                undoer, manifests, counts, fingerprints, show_all=True
+            )
+            return
 
-        selected_idx = manifest_items.index(selected)
-        manifest = manifests[selected_idx]
-        file_count = self._count_manifest_lines(manifest.path)
+        manifest, file_count, exact = items[selected]
+        if not exact:
+            # Labels may be estimates; confirm and size the dialog exactly
+            file_count = self._count_manifest_exactly(manifest.path)
 
-        reply = QMessageBox.question(
-            self,
+        reply = self._show_message(
+            QMessageBox.Icon.Question,
             "Confirm Undo",
             f"Undo will restore {file_count} files to their original locations.\n\n"
             f"Manifest: {manifest.formatted_date}\n\n"
             "Continue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
+            _YES_NO,
+            _NO,
         )
 
-        if reply != QMessageBox.StandardButton.Yes:
+        if reply != _YES:
             return
 
         self._toggle_controls(processing=True)
 
+        self.log_viewer.log(f"Starting undo of {file_count} files...", "info")
+
+        self._undo_error_logger = ErrorLogger()
+        self._undo_error_logger.initialize()
+        self._undo_latest_progress = (0, file_count)
+        # The progress dialog is only built if the undo is still running
+        # after UNDO_DIALOG_MIN_DURATION_MS; quick undos never create it
+        self._undo_dialog_timer.start()
+
+        # Worker signals cross threads: connect them queued explicitly
+        queued = Qt.ConnectionType.QueuedConnection
+        # file_count is exact here (estimates were resolved above); 0 may
+        # mean unreadable, so let the worker count and report that itself
+        self.undo_worker = UndoWorker(
+            manifest.path, undoer, total_count=file_count or None
+        )
+        self.undo_worker.progress.connect(self._on_undo_progress, queued)
+        self.undo_worker.log_message.connect(self._on_undo_log, queued)
+        self.undo_worker.error_log.connect(self._on_undo_error, queued)
+        self.undo_worker.finished.connect(self._on_undo_finished, queued)
+
+        self.undo_worker.start()
+
+    @Slot()
+    def _show_undo_progress_dialog(self) -> None:
+        """Create and show the undo progress dialog for a long-running undo."""
+        if self.undo_worker is None or self._undo_progress_dialog is not None:
+            return
+        current, total = self._undo_latest_progress
         progress = QProgressDialog(
             "Undoing file moves...",
             "Cancel",
             0,
-            file_count,
+            total,
             self,
         )
         progress.setWindowTitle("Undo in Progress")
         progress.setWindowModality(Qt.WindowModality.WindowModal)
+        # Already past the delay: show right away
         progress.setMinimumDuration(0)
-        progress.setValue(0)
-
-        self.log_viewer.log(f"Starting undo of {file_count} files...", "info")
-
-        undo_error_logger = ErrorLogger()
-        undo_error_logger.initialize()
+        progress.canceled.connect(self.undo_worker.request_cancel)
+        self._undo_progress_dialog = progress
+        self._flush_undo_progress()
+        progress.show()
 
-        def on_error(context: str, file: str, error: str) -> None:
-            self.log_viewer.log(f"{context}: {file} - {error}", "error")
-            undo_error_logger.log_error(context, file, error)
+    @Slot(int, int)
+    def _on_undo_progress(self, current: int, total: int) -> None:
+        """Record undo progress; the dialog is refreshed by _flush_undo_progress."""
+        self._undo_latest_progress = (current, total)
+        if not self._undo_progress_timer.isActive():
+            self._undo_progress_timer.start()
 
-        self.undo_worker = UndoWorker(manifest.path, undoer)
-        self.undo_worker.progress.connect(progress.setValue)
-        self.undo_worker.progress.connect(
-            lambda c, t: progress.setLabelText(f"Restoring file {c} of {t}...")
+    @Slot()
+    def _flush_undo_progress(self) -> None:
+        """Apply the latest undo progress to the progress dialog."""
+        if self._undo_progress_dialog is None:
+            return
+        current, total = self._undo_latest_progress
+        self._undo_progress_dialog.setValue(current)
+        self._undo_progress_dialog.setLabelText(
+            f"Restoring file {current} of {total}..."
         )
-        self.undo_worker.log_message.connect(lambda m: self.log_viewer.log(m, "info"))
-        self.undo_worker.error_log.connect(on_error)
 
-        progress.canceled.connect(self.undo_worker.request_cancel)
+    @Slot(str)
+    def _on_undo_log(self, message: str) -> None:
+        """Show an undo log message."""
+        self.log_viewer.log(message, "info")
 
-        def on_finished(result: UndoResult) -> None:
+    @Slot(str, str, str)
+    def _on_undo_error(self, context: str, file: str, error: str) -> None:
+        """Show an undo error and record it in the undo error log."""
+        self.log_viewer.log(f"{context}: {file} - {error}", "error")
+        if self._undo_error_logger is not None:
+            self._undo_error_logger.log_error(context, file, error)
+
+    @Slot(object)
+    def _on_undo_finished(self, result: UndoResult) -> None:
+        """Close the undo progress dialog and report the result."""
+        progress = self._undo_progress_dialog
+        self._undo_dialog_timer.stop()
+        self._undo_progress_timer.stop()
+        self._undo_progress_dialog = None
+        canceled = progress is not None and progress.wasCanceled()
+        if progress is not None:
             progress.close()
-            undo_error_logger.close()
-            self._toggle_controls(processing=False)
-
-            if progress.wasCanceled():
-                self.log_viewer.log("Undo cancelled by user", "warning")
-                QMessageBox.warning(
-                    self,
-                    "Undo Cancelled",
-                    f"Undo was cancelled.\n\n"
-                    f"Restored: {result.success_count} files\n"
-                    f"Remaining: {result.total_count - result.success_count} files",
-                )
-            elif result.failed_count > 0:
-                self.log_viewer.log(
-                    f"Undo completed with errors: {result.success_count} restored, "
-                    f"{result.failed_count} failed",
-                    "warning",
-                )
-                QMessageBox.warning(
-                    self,
-                    "Undo Completed with Errors",
-                    f"Undo completed with some errors.\n\n"
-                    f"Restored: {result.success_count} files\n"
-                    f"Failed: {result.failed_count} files\n\n"
-                    "Check the log for details.",
-                )
-            else:
-                self.log_viewer.log(
-                    f"Undo complete: {result.success_count} files restored", "success"
-                )
-                QMessageBox.information(
-                    self,
-                    "Undo Complete",
-                    f"Successfully restored {result.success_count} files "
-                    f"to their original locations.",
-                )
-
-        self.undo_worker.finished.connect(on_finished)
-        self.undo_worker.start()
+        error_logger, self._undo_error_logger = self._undo_error_logger, None
+        if error_logger is not None:
+            error_logger.close()
+        self._toggle_controls(processing=False)
 
-    def _count_manifest_lines(self, path: Path) -> int:
-        """Count number of file entries in a manifest."""
-        try:
-            with open(path, "r") as f:
-                return sum(1 for line in f if line.strip() and not line.startswith("#"))
-        except Exception:
-            return 0
+        if canceled:
+            self.log_viewer.log("Undo cancelled by user", "warning")
+            self._show_message(
+                QMessageBox.Icon.Warning,
+                "Undo Cancelled",
+                f"Undo was cancelled.\n\n"
+                f"Restored: {result.success_count} files\n"
+                f"Remaining: {result.total_count - result.success_count} files",
+            )
+        elif result.failed_count > 0:
+            self.log_viewer.log(
+                f"Undo completed with errors: {result.success_count} restored, "
+                f"{result.failed_count} failed",
+                "warning",
+            )
+            self._show_message(
+                QMessageBox.Icon.Warning,
+                "Undo Completed with Errors",
+                f"Undo completed with some errors.\n\n"
+                f"Restored: {result.success_count} files\n"
+                f"Failed: {result.failed_count} files\n\n"
+                "Check the log for details.",
+            )
+        else:
+            self.log_viewer.log(
+                f"Undo complete: {result.success_count} files restored", "success"
+            )
+            self._show_message(
+                QMessageBox.Icon.Information,
+                "Undo Complete",
+                f"Successfully restored {result.success_count} files "
+                f"to their original locations.",
+            )
@@ -2,6 +2,7 @@
 Detailed stats dialog shown when stat cards are clicked.
 """
 
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -22,7 +23,11 @@ class StatsDetailDialog(QDialog):
         layout = QVBoxLayout(self)
 
         summary = QLabel(f"Items in category '{category}': {count}")
-        summary.setStyleSheet("font-size: 14px; font-weight: 600;")
+        # Font instead of a stylesheet: no CSS parse each time a card is clicked
+        summary_font = summary.font()
+        summary_font.setPixelSize(14)
+        summary_font.setWeight(QFont.Weight.DemiBold)
+        summary.setFont(summary_font)
         layout.addWidget(summary)
 
         table = QTableWidget(0, 2)
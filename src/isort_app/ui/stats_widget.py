@@ -6,9 +6,45 @@ Displays real-time statistics in a grid of styled cards,
 each with a value and label.
 """
 
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtWidgets import QGridLayout, QGroupBox, QLabel, QVBoxLayout, QWidget
 
+# Stats configuration: (key, label, color)
+_STATS = (
+    ("files_moved", "Files Moved", "#4a9eff"),
+    ("iphone_photos", "iPhone Photos", "#22c55e"),
+    ("iphone_videos", "iPhone Videos", "#8b5cf6"),
+    ("screenshots", "Screenshots", "#f59e0b"),
+    ("snapchat", "Snapchat", "#fffc00"),
+    ("non_apple", "Non-Apple", "#ec4899"),
+    ("errors", "Errors", "#ef4444"),
+)
+
+# One sheet for all cards, applied to the widget once instead of three
+# per-card sheets; each card's accent color is selected by objectName
+_STATS_QSS = """
+QGroupBox {
+    background-color: #2d2d2d;
+    border-radius: 12px;
+    padding: 16px;
+    border-top: none;
+    border-right: none;
+    border-bottom: none;
+}
+QLabel#value {
+    font-size: 28px;
+    font-weight: bold;
+}
+QLabel#name {
+    font-size: 12px;
+    color: #888888;
+}
+""" + "".join(
+    f"QGroupBox#card_{key} {{ border-left: 4px solid {color}; }}\n"
+    f"#card_{key} QLabel#value {{ color: {color}; }}\n"
+    for key, _, color in _STATS
+)
+
 
 class StatsWidget(QWidget):
     """
@@ -21,57 +57,48 @@ class StatsWidget(QWidget):
     def __init__(self):
         super().__init__()
 
+        self.setStyleSheet(_STATS_QSS)
+
         # Main grid layout
         layout = QGridLayout(self)
         layout.setSpacing(16)
 
-        # Stats configuration: (key, label, color)
-        stats = [
-            ("files_moved", "Files Moved", "#4a9eff"),
-            ("iphone_photos", "iPhone Photos", "#22c55e"),
-            ("iphone_videos", "iPhone Videos", "#8b5cf6"),
-            ("screenshots", "Screenshots", "#f59e0b"),
-            ("snapchat", "Snapchat", "#fffc00"),
-            ("non_apple", "Non-Apple", "#ec4899"),
-            ("errors", "Errors", "#ef4444"),
-        ]
-
-        # Store value labels for updates
+        # Store value labels for updates, and the value each one shows
         self.stat_labels: dict[str, QLabel] = {}
+        self._shown_values: dict[str, int] = {}
 
         # Create stat cards in 3-column grid
-        for i, (key, label, color) in enumerate(stats):
-            card, value_label = self._create_stat_card(label, color)
+        for i, (key, label, _) in enumerate(_STATS):
+            card, value_label = self._create_stat_card(key, label)
             self.stat_labels[key] = value_label
+            self._shown_values[key] = 0
 
             row, col = divmod(i, 3)
             layout.addWidget(card, row, col)
 
-    def _create_stat_card(self, label: str, color: str) -> tuple[QGroupBox, QLabel]:
+        # Optional live counter (ctypes.c_int64-like, read via .value) polled
+        # for the files_moved card while a worker is running
+        self._live_counter = None
+        self._live_timer = QTimer(self)
+        self._live_timer.setInterval(250)
+        self._live_timer.timeout.connect(self._poll_live_counter)
+
+        # Updates received while the tab is hidden, applied on showEvent
+        self._pending_stats: dict[str, int] = {}
+
+    def _create_stat_card(self, key: str, label: str) -> tuple[QGroupBox, QLabel]:
         """
-        Create a styled stat card.
+        Create a stat card, styled through its objectName.
 
         Args:
+            key: Stats key (selects the card's accent color)
             label: Display name for the stat
-            color: Accent color (hex string)
 
         Returns:
             Tuple of (card widget, value label for updates)
         """
         card = QGroupBox()
-        card.setStyleSheet(
-            f"""
-            QGroupBox {{
-                background-color: #2d2d2d;
-                border-radius: 12px;
-                padding: 16px;
-                border-left: 4px solid {color};
-                border-top: none;
-                border-right: none;
-                border-bottom: none;
-            }}
-        """
-        )
+        card.setObjectName(f"card_{key}")
 
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(4)
@@ -79,43 +106,69 @@ class StatsWidget(QWidget):
         # Value label (large, bold, colored)
         value_label = QLabel("0")
         value_label.setObjectName("value")
-        value_label.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 28px;
-                font-weight: bold;
-                color: {color};
-            }}
-        """
-        )
 
         # Name label (small, gray)
         name_label = QLabel(label)
-        name_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 12px;
-                color: #888888;
-            }
-        """
-        )
+        name_label.setObjectName("name")
 
         card_layout.addWidget(value_label)
         card_layout.addWidget(name_label)
 
         return card, value_label
 
+    def bind_live_counter(self, counter) -> None:
+        """
+        Start polling a shared counter for the files_moved card.
+
+        Args:
+            counter: Object exposing the current count via ``.value``,
+                     or None to stop polling
+        """
+        self._live_counter = counter
+        if counter is None:
+            self._live_timer.stop()
+        else:
+            self._live_timer.start()
+
+    @Slot()
+    def _poll_live_counter(self) -> None:
+        """Refresh the files_moved card from the bound live counter."""
+        if self._live_counter is None or not self.isVisible():
+            return
+        self._show_value("files_moved", self._live_counter.value)
+
     @Slot(dict)
     def update_stats(self, stats: dict) -> None:
         """
         Update stat card values from a stats dictionary.
 
+        Updates arriving while the widget is hidden are merged and applied
+        when it is next shown.
+
         Args:
             stats: Dictionary with stat keys and integer values
         """
-        for key, label in self.stat_labels.items():
-            if key in stats:
-                label.setText(f"{stats[key]:,}")
+        if not self.isVisible():
+            self._pending_stats.update(stats)
+            return
+        # Buffered updates carry only changed keys: walk those, not all cards
+        for key, value in stats.items():
+            if key in self.stat_labels:
+                self._show_value(key, value)
+
+    def _show_value(self, key: str, value: int) -> None:
+        """Set a card's value label, skipping the format/repaint if unchanged."""
+        if self._shown_values.get(key) != value:
+            self._shown_values[key] = value
+            self.stat_labels[key].setText(f"{value:,}")
+
+    def showEvent(self, event) -> None:
+        """Apply stats and live count deferred while the widget was hidden."""
+        super().showEvent(event)
+        if self._pending_stats:
+            pending, self._pending_stats = self._pending_stats, {}
+            self.update_stats(pending)
+        self._poll_live_counter()
 
 
 __all__ = ["StatsWidget"]
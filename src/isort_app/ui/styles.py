@@ -0,0 +1,196 @@
+# ui/styles.py
+"""
+Shared Qt stylesheet for the main window.
+
+Applied once to the central widget so Qt parses it in a single pass
+instead of once per widget. Widgets are targeted by objectName.
+
+Rule order matters: the window background comes first, then frames,
+then the widgets inside them. Frame rules use "QFrame#name, #name QFrame"
+so they also reach child QFrames (labels and text views are QFrames),
+matching the old per-widget sheets; later rules with equal specificity
+win, which reproduces "nearest stylesheet wins".
+"""
+
+MAIN_WINDOW_QSS = """
+QWidget {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #0f1014, stop:1 #0b0c10);
+}
+
+/* === Header === */
+#app_icon { font-size: 36px; color: #4a9eff; }
+#app_title { font-size: 28px; font-weight: bold; color: #ffffff; }
+#app_subtitle { font-size: 14px; color: #888888; }
+#version_label { font-size: 14px; color: #888888; }
+#engine_label { font-size: 12px; color: #666666; }
+
+/* === Section frames === */
+QFrame#source_frame, #source_frame QFrame,
+QFrame#options_frame, #options_frame QFrame,
+QFrame#progress_frame, #progress_frame QFrame {
+    background: #1f2025;
+    border-radius: 12px;
+    border: 1px solid #2f3038;
+}
+
+QFrame#tab_frame, #tab_frame QFrame {
+    background-color: #2d2d2d;
+    border-radius: 12px;
+}
+
+/* === Source folder === */
+#source_title, #options_title {
+    font-size: 13px;
+    color: #888888;
+    font-weight: bold;
+}
+#folder_icon { font-size: 18px; }
+#source_path {
+    font-size: 14px;
+    color: #888888;
+    font-family: 'SF Mono', 'Menlo', monospace;
+}
+#source_path[selected="true"] { color: #ffffff; }
+
+#browse_btn {
+    background-color: #3d3d3d;
+    color: #ffffff;
+    border: none;
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: 13px;
+}
+#browse_btn:hover { background-color: #4d4d4d; }
+
+/* === Options === */
+#mode_label { font-size: 14px; color: #ffffff; }
+
+QComboBox#mode_combo {
+    background-color: #3d3d3d;
+    color: #ffffff;
+    border: none;
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: 13px;
+    min-width: 160px;
+}
+QComboBox#mode_combo::drop-down {
+    border: none;
+    padding-right: 8px;
+}
+QComboBox#mode_combo::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 6px solid #888888;
+    margin-right: 8px;
+}
+#mode_combo QAbstractItemView {
+    background-color: #3d3d3d;
+    color: #ffffff;
+    selection-background-color: #4a9eff;
+}
+
+#options_frame QCheckBox {
+    font-size: 14px;
+    color: #ffffff;
+    spacing: 8px;
+}
+#options_frame QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+    border-radius: 9px;
+    border: 2px solid #555555;
+    background-color: #2d2d2d;
+}
+#options_frame QCheckBox::indicator:checked {
+    background-color: #4a9eff;
+    border-color: #4a9eff;
+}
+
+/* === Progress === */
+#status_label { font-size: 14px; color: #ffffff; }
+#progress_text {
+    font-size: 14px;
+    color: #888888;
+    font-family: 'SF Mono', monospace;
+}
+
+QProgressBar#progress_bar {
+    border: none;
+    border-radius: 6px;
+    background-color: #3d3d3d;
+    height: 12px;
+}
+/* Solid fill: repainted on every progress step, a gradient costs more */
+QProgressBar#progress_bar::chunk {
+    border-radius: 6px;
+    background-color: #4a9eff;
+}
+
+/* === Tabs === */
+QTabWidget#tab_widget::pane {
+    border: none;
+    background-color: #2d2d2d;
+    border-radius: 12px;
+}
+#tab_widget QTabBar::tab {
+    background-color: transparent;
+    color: #888888;
+    padding: 10px 20px;
+    font-size: 14px;
+    border: none;
+    margin-right: 4px;
+}
+#tab_widget QTabBar::tab:selected {
+    background-color: #4a9eff;
+    color: #ffffff;
+    border-radius: 8px;
+}
+#tab_widget QTabBar::tab:hover:!selected {
+    color: #ffffff;
+}
+
+QPlainTextEdit#results_viewer {
+    background-color: #1a1a1a;
+    color: #888888;
+    border: none;
+    border-radius: 8px;
+    padding: 16px;
+    font-family: 'SF Mono', 'Menlo', monospace;
+    font-size: 14px;
+}
+
+/* === Action buttons === */
+QPushButton#undo_btn {
+    background-color: transparent;
+    color: #ef4444;
+    border: 2px solid #ef4444;
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-size: 14px;
+    font-weight: bold;
+}
+QPushButton#undo_btn:hover {
+    background-color: rgba(239, 68, 68, 0.1);
+}
+
+QPushButton#start_btn, QPushButton#stop_btn {
+    color: #ffffff;
+    border: none;
+    border-radius: 8px;
+    padding: 12px 32px;
+    font-size: 14px;
+    font-weight: bold;
+}
+QPushButton#start_btn { background-color: #22c55e; }
+QPushButton#start_btn:hover { background-color: #16a34a; }
+QPushButton#stop_btn { background-color: #ef4444; }
+QPushButton#stop_btn:hover { background-color: #dc2626; }
+QPushButton#start_btn:disabled, QPushButton#stop_btn:disabled {
+    background-color: #4a4a4a;
+}
+"""
+
+__all__ = ["MAIN_WINDOW_QSS"]
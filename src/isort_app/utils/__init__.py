@@ -1,14 +1,20 @@
 # Utility modules
+# - appender: Background writer thread for append-only files
 # - checkpoint: Checkpoint save/restore functionality
 # - manifest: Manifest file handling and undo system
 # - error_log: Error logging utilities
+# - walk: Fast recursive file listing via os.scandir
 # - tools: External tool wrappers (exiftool, mdls, mediainfo)
 
+from isort_app.utils.appender import AsyncAppender
 from isort_app.utils.checkpoint import CheckpointManager
 from isort_app.utils.error_log import ErrorLogger
 from isort_app.utils.manifest import ManifestInfo, ManifestManager, ManifestUndoer, UndoResult
+from isort_app.utils.walk import walk_fast
 
 __all__ = [
+    # Appender
+    "AsyncAppender",
     # Checkpoint
     "CheckpointManager",
     # Manifest
@@ -18,4 +24,6 @@ __all__ = [
     "UndoResult",
     # Error logging
     "ErrorLogger",
+    # File walking
+    "walk_fast",
 ]
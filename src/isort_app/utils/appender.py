@@ -0,0 +1,154 @@
+# utils/appender.py
+"""
+Background file appender for log-style output.
+
+Callers hand finished lines to put(), which only enqueues them; a single
+writer thread drains everything queued into one reusable bytearray and
+appends it with a single os.write() on the file's descriptor. Text is
+encoded like os.fsencode() (UTF-8 with surrogateescape), so paths with
+undecodable bytes round-trip instead of stopping the writer. Used by
+ErrorLogger and ManifestManager so disk latency stays off the
+file-organization hot path.
+
+Usage:
+    fh = open(path, "a", encoding="utf-8")
+    appender = AsyncAppender(fh, name="isort-manifest-writer")
+    appender.put("source|dest\\n")
+    appender.flush()   # Blocks until everything queued so far is written
+    appender.close()   # Drains the queue and stops the thread
+    fh.close()
+"""
+
+import logging
+import os
+import queue
+import threading
+from typing import TextIO, Union
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on bytes gathered per os.write() while draining the queue
+APPENDER_MAX_WRITE = 1024 * 1024
+
+# How often flush() re-checks that the writer thread is still running
+APPENDER_FLUSH_POLL_SECONDS = 0.5
+
+
+class AsyncAppender:
+    """
+    Appends text to an open file from a dedicated writer thread.
+
+    Writes go straight to fh.fileno(), bypassing the handle's own buffer;
+    the handle must be opened in append mode and not written through
+    while the appender is running. Text is encoded as UTF-8 with
+    surrogateescape. The handle stays owned by the caller: close() stops
+    the thread after draining the queue but does not close the handle.
+
+    An item that cannot be written is logged and dropped; the writer keeps
+    going. If the thread dies anyway, put() and flush() raise RuntimeError
+    instead of queueing data nobody will write.
+    """
+
+    def __init__(self, fh: TextIO, name: str = "isort-appender"):
+        """
+        Initialize the appender and start its writer thread.
+
+        Args:
+            fh: Open text file handle to append to
+            name: Writer thread name (shown in debuggers/profilers)
+        """
+        self._name = getattr(fh, "name", name)
+        self._fd = fh.fileno()
+        self._queue: "queue.SimpleQueue[Union[str, threading.Event, None]]" = (
+            queue.SimpleQueue()
+        )
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, text: str) -> None:
+        """
+        Queue text for appending.
+
+        Args:
+            text: Text to write (including any trailing newline)
+
+        Raises:
+            RuntimeError: If the writer thread is no longer running
+        """
+        self._check_alive()
+        self._queue.put(text)
+
+    def flush(self) -> None:
+        """
+        Block until all previously queued data is written.
+
+        Raises:
+            RuntimeError: If the writer thread stops before getting there
+        """
+        if self._closed:
+            return
+        self._check_alive()
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(APPENDER_FLUSH_POLL_SECONDS):
+            self._check_alive()
+
+    def close(self) -> None:
+        """Write remaining queued data and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _check_alive(self) -> None:
+        """Raise RuntimeError if the writer thread has died."""
+        if not self._thread.is_alive():
+            raise RuntimeError(f"Writer thread for {self._name} is not running")
+
+    def _run(self) -> None:
+        """Writer thread loop - drains and writes batches until the None sentinel."""
+        q = self._queue
+        buf = bytearray()
+        stopping = False
+        while not stopping:
+            waiters = []
+            item = q.get()
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                try:
+                    if isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        buf += item.encode("utf-8", "surrogateescape")
+                except Exception as e:
+                    logger.error("Dropped unwritable data for %s: %s", self._name, e)
+                if len(buf) >= APPENDER_MAX_WRITE:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+
+            if buf:
+                self._write(buf)
+            buf.clear()
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, buf: bytearray) -> None:
+        """Append buf to the file, logging (not raising) failures."""
+        try:
+            written = os.write(self._fd, buf)
+            while written < len(buf):
+                # Rare partial write: drop what landed and retry the rest
+                del buf[:written]
+                written = os.write(self._fd, buf)
+        except Exception as e:
+            logger.error("Failed to append to %s: %s", self._name, e)
+
+
+__all__ = ["AsyncAppender", "APPENDER_MAX_WRITE", "APPENDER_FLUSH_POLL_SECONDS"]
@@ -24,6 +24,7 @@ Usage:
 """
 
 import logging
+import os
 import tempfile
 from pathlib import Path
 from typing import Tuple, Optional, Union
@@ -42,40 +43,106 @@ class CheckpointManager:
     after crashes or interruptions.
     """
 
-    def __init__(self, checkpoint_path: Path | str | None = None):
+    def __init__(
+        self,
+        checkpoint_path: Path | str | None = None,
+        durable: bool = False,
+    ):
         """
         Initialize the CheckpointManager.
 
         Args:
             checkpoint_path: Path to checkpoint file (default: ~/Desktop/isort.checkpoint)
+            durable: If True, fsync each save before it replaces the checkpoint
         """
         if checkpoint_path is None:
             self.checkpoint_path = DEFAULT_CHECKPOINT_PATH
         else:
             self.checkpoint_path = Path(checkpoint_path)
 
-    def save(self, phase: str, index: int, folder_path: Path | str) -> None:
+        self.durable = durable
+
+        # Last (phase, index, folder) written, to skip redundant saves
+        self._last_saved: Optional[Tuple[str, int, str]] = None
+
+        # Parsed load() result, keyed by the file's (st_mtime_ns, st_size)
+        self._load_key: Optional[Tuple[int, int]] = None
+        self._load_cache: Optional[Tuple[str, int, str | None, bool]] = None
+
+    def save(
+        self,
+        phase: str,
+        index: int,
+        folder_path: Path | str,
+        durable: Optional[bool] = None,
+    ) -> None:
         """
         Save checkpoint to disk.
 
-        Uses atomic write (temp file + rename) to prevent corruption.
+        Uses atomic write (temp file + os.replace) to prevent corruption.
+        Saving the same position twice in a row is a no-op unless the
+        save is durable.
 
         Args:
             phase: Current phase name (e.g., "extract", "organize")
             index: Current file index within the phase
             folder_path: Path of the folder being processed (to prevent stale resume)
+            durable: fsync this save (default: the durable constructor flag)
         """
+        if durable is None:
+            durable = self.durable
+
+        key = (phase, index, str(folder_path))
+        if key == self._last_saved and not durable:
+            return
+
         try:
             # Atomic write: write to temp file, then rename
             temp_path = self.checkpoint_path.with_suffix(".tmp")
-            temp_path.write_text(
-                f"{phase}|{index}|{str(folder_path)}\n", encoding="utf-8"
-            )
-            temp_path.rename(self.checkpoint_path)
+            payload = f"{phase}|{index}|{key[2]}\n".encode("utf-8")
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                if durable:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            # os.replace overwrites atomically on Windows too (Path.rename does not)
+            os.replace(temp_path, self.checkpoint_path)
+            self._load_key = None
+            if durable:
+                self._fsync_parent_dir()
+            self._last_saved = key
             logger.debug("Checkpoint saved: %s|%d|%s", phase, index, folder_path)
         except OSError as e:
             logger.warning("Failed to save checkpoint: %s", e)
 
+    def checkpoint_phase_boundary(
+        self, phase: str, index: int, folder_path: Path | str
+    ) -> None:
+        """
+        Durably save a checkpoint at a phase change or final position.
+
+        Rename-only saves are enough to never see a partial checkpoint;
+        boundaries are additionally fsynced so resume survives power loss.
+        """
+        self.save(phase, index, folder_path, durable=True)
+
+    def _fsync_parent_dir(self) -> None:
+        """Persist the rename itself by syncing the parent directory (POSIX only)."""
+        if os.name != "posix":
+            return
+        try:
+            fd = os.open(self.checkpoint_path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
     def load(self) -> Tuple[str, int, str | None, bool]:
         """
         Load checkpoint from disk.
@@ -84,9 +151,25 @@ class CheckpointManager:
             Tuple of (phase, index, saved_folder, is_invalid), or ("none", 0, None, False) if no checkpoint exists.
             is_invalid is True if the checkpoint file exists but is corrupted/incompatible.
         """
-        if not self.checkpoint_path.exists():
+        try:
+            st = os.stat(self.checkpoint_path)
+        except FileNotFoundError:
             return ("none", 0, None, False)
+        except OSError as e:
+            logger.warning("Failed to load checkpoint: %s", e)
+            return ("none", 0, None, True)
+
+        # Reuse the parsed result while the file is unchanged
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._load_key and self._load_cache is not None:
+            return self._load_cache
+
+        self._load_cache = self._read_checkpoint()
+        self._load_key = key
+        return self._load_cache
 
+    def _read_checkpoint(self) -> Tuple[str, int, str | None, bool]:
+        """Read and parse the checkpoint file (see load() for the result)."""
         try:
             content = self.checkpoint_path.read_text(encoding="utf-8").strip()
             if "|" not in content:
@@ -116,6 +199,8 @@ class CheckpointManager:
 
         Called after successful completion to prevent stale resume.
         """
+        self._last_saved = None
+        self._load_key = None
         try:
             if self.checkpoint_path.exists():
                 self.checkpoint_path.unlink()
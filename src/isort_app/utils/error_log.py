@@ -5,7 +5,9 @@ Centralized error logging utilities.
 Ports error logging logic from isort.zsh lines 200-220.
 
 Provides timestamped error logging to Desktop file for debugging
-and user review. Thread-safe via append mode.
+and user review. Entries are appended by a background writer thread
+(utils.appender.AsyncAppender) through a handle kept open between
+initialize() and close().
 
 Usage:
     # As standalone logger
@@ -21,9 +23,13 @@ Usage:
 
 import logging
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
+
+from isort_app.utils.appender import AsyncAppender
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +82,11 @@ class ErrorLogger:
         self._initialized = False
         self._error_count = 0
         self._keep_empty = keep_empty
+        self._fh: Optional[TextIO] = None
+        self._appender: Optional[AsyncAppender] = None
+        self._lock = threading.Lock()
+        # (epoch second, formatted timestamp) - strftime once per second
+        self._ts_cache: tuple[int, str] = (0, "")
 
     def initialize(self) -> None:
         """
@@ -93,6 +104,8 @@ class ErrorLogger:
             header = f"=== iSort Error Log - {date_str} ===\n\n"
 
             self.log_path.write_text(header, encoding="utf-8")
+            self._fh = open(self.log_path, "a", encoding="utf-8")
+            self._appender = AsyncAppender(self._fh, name="isort-error-log-writer")
             self._initialized = True
             logger.info("Error log initialized: %s", self.log_path)
 
@@ -109,20 +122,24 @@ class ErrorLogger:
             file: File path associated with the error
             error: Error message/description
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] {context}: {file} - {error}\n"
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (
+                now,
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+            )
+        log_line = f"[{self._ts_cache[1]}] {context}: {file} - {error}\n"
 
         self._error_count += 1
 
-        # Try to write to file
-        if self._initialized:
-            try:
-                # Append mode for thread-safety
-                with open(self.log_path, "a", encoding="utf-8") as f:
-                    f.write(log_line)
-                return
-            except OSError as e:
-                logger.warning("Failed to write to error log: %s", e)
+        # Hand off to the writer thread
+        with self._lock:
+            if self._appender is not None:
+                try:
+                    self._appender.put(log_line)
+                    return
+                except RuntimeError:
+                    pass
 
         # Fallback to stderr if file logging fails
         print(log_line.strip(), file=sys.stderr)
@@ -139,10 +156,16 @@ class ErrorLogger:
         Adds footer with error count if any errors were logged.
         Called automatically by context manager or manually after logging.
         """
-        if self._initialized and self._error_count > 0:
+        with self._lock:
+            fh, self._fh = self._fh, None
+            appender, self._appender = self._appender, None
+
+        if appender is not None:
+            appender.close()
+
+        if fh is not None and self._error_count > 0:
             try:
-                with open(self.log_path, "a", encoding="utf-8") as f:
-                    f.write(f"\n=== Total errors: {self._error_count} ===\n")
+                fh.write(f"\n=== Total errors: {self._error_count} ===\n")
                 logger.info(
                     "Error log finalized: %s (%d errors)",
                     self.log_path,
@@ -150,7 +173,14 @@ class ErrorLogger:
                 )
             except OSError as e:
                 logger.warning("Failed to finalize error log: %s", e)
-        elif self._initialized and self._error_count == 0:
+
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError as e:
+                logger.warning("Failed to close error log: %s", e)
+
+        if self._initialized and self._error_count == 0:
             if self._keep_empty:
                 # Preserve empty log for audit trail
                 logger.debug("Keeping empty error log: %s", self.log_path)
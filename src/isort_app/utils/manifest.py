@@ -21,18 +21,42 @@ Usage:
         print(f"Restored {result.success_count} files")
 """
 
+import errno
 import logging
+import os
+import re
 import shutil
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from isort_app.utils.appender import AsyncAppender
 
 logger = logging.getLogger(__name__)
 
 # Default manifest directory
 DEFAULT_MANIFEST_DIR = Path.home() / "Desktop"
 
+# Text manifest counting: deleting every byte except "\n" and "|" leaves
+# "|\n" at the end of each line that contains a "|"
+_KEEP_PIPES_AND_NEWLINES = bytes(b for b in range(256) if b not in b"\n|")
+
+# Start of a comment line after the first: newline, whitespace, "#"
+_TEXT_COMMENT_RE = re.compile(rb"\n[ \t\r\f\v]*#")
+
+# Text manifests are counted in line-aligned blocks of about this size
+_COUNT_BLOCK_SIZE = 1024 * 1024
+
+# Bytes read from the start of a manifest to estimate its move count
+MANIFEST_SAMPLE_BYTES = 64 * 1024
+
+# Manifest filename: isort_manifest_YYYYMMDD_HHMMSS.txt
+_MANIFEST_NAME_RE = re.compile(
+    r"^isort_manifest_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})\.txt$"
+)
+
 
 @dataclass
 class ManifestInfo:
@@ -59,12 +83,57 @@ ErrorLogCallback = Callable[[str, str, str], None]
 ShouldCancelCallback = Callable[[], bool]
 
 
+def _advise_sequential(fd: int) -> None:
+    """Hint that fd will be read front to back (no-op where unsupported)."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _count_text_records(block: bytes) -> int:
+    """
+    Count move records in a block of whole text-manifest lines.
+
+    A record is a line that, stripped, is non-empty, not a "#" comment and
+    contains "|" - the lines ManifestUndoer._iter_moves() parses. Counting
+    uses bytes.translate()/count() and a literal-prefixed regex, so the
+    per-line work happens in C rather than in a Python loop.
+
+    Args:
+        block: Manifest bytes, split only at line boundaries
+
+    Returns:
+        Number of move records in block
+    """
+    if not block:
+        return 0
+    pipes = block.translate(None, _KEEP_PIPES_AND_NEWLINES)
+    count = pipes.count(b"|\n") + pipes.endswith(b"|")
+
+    # Comment lines (e.g. "# Format: SOURCE|DESTINATION") may contain "|"
+    end = block.find(b"\n")
+    first_line = block if end == -1 else block[:end]
+    if first_line.strip().startswith(b"#") and b"|" in first_line:
+        count -= 1
+    for match in _TEXT_COMMENT_RE.finditer(block):
+        end = block.find(b"\n", match.end())
+        if b"|" in block[match.end() : end if end != -1 else len(block)]:
+            count -= 1
+    return count
+
+
 class ManifestManager:
     """
     Manages manifest file creation and move recording.
 
     Creates timestamped manifest files on Desktop, recording all file
     moves in pipe-delimited format for later undo.
+
+    Records are appended by a background writer thread through a file
+    handle kept open until close(); record_move() only enqueues and
+    flush() waits for the queue to drain.
     """
 
     def __init__(
@@ -91,6 +160,9 @@ class ManifestManager:
             self.manifest_path = manifest_dir / f"isort_manifest_{timestamp}.txt"
 
         self._initialized = False
+        self._fh: Optional[TextIO] = None
+        self._appender: Optional[AsyncAppender] = None
+        self._lock = threading.Lock()
 
     def initialize(self) -> None:
         """
@@ -108,6 +180,8 @@ class ManifestManager:
             header = f"# iSort Manifest - {date_str}\n# Format: SOURCE|DESTINATION\n"
 
             self.manifest_path.write_text(header, encoding="utf-8")
+            self._fh = open(self.manifest_path, "a", encoding="utf-8")
+            self._appender = AsyncAppender(self._fh, name="isort-manifest-writer")
             self._initialized = True
             logger.info("Manifest initialized: %s", self.manifest_path)
 
@@ -126,24 +200,65 @@ class ManifestManager:
         if not self._initialized:
             self.initialize()
 
+        with self._lock:
+            if self._appender is not None:
+                self._appender.put(f"{source}|{dest}\n")
+                return
+        logger.error("Failed to record move (manifest closed): %s", source)
+
+    def flush(self) -> None:
+        """
+        Block until every record queued so far is written and flushed.
+
+        Call at checkpoint boundaries so an interrupted run keeps every
+        move recorded so far.
+        """
+        with self._lock:
+            appender = self._appender
+        if appender is not None:
+            appender.flush()
+
+    def sync(self) -> None:
+        """
+        Flush recorded moves and fsync the manifest.
+
+        Call before a durable (fsynced) checkpoint so the checkpoint never
+        points past moves the manifest could still lose on power failure.
+        """
+        with self._lock:
+            fh, appender = self._fh, self._appender
+        if fh is None or appender is None:
+            return
+        appender.flush()
         try:
-            with open(self.manifest_path, "a", encoding="utf-8") as f:
-                f.write(f"{source}|{dest}\n")
-        except OSError as e:
-            logger.error("Failed to record move: %s", e)
+            os.fsync(fh.fileno())
+        except (OSError, ValueError) as e:
+            logger.error("Failed to sync manifest: %s", e)
 
     def close(self) -> None:
         """
         Finalize the manifest file.
 
-        Currently performs no resource cleanup since record_move() uses
-        append mode without persistent file handles. Retained for API
-        stability and future extensibility.
+        Drains the writer thread, fsyncs and closes the file handle.
+        Safe to call more than once.
 
         Called automatically by context manager or manually after recording.
         """
-        if self._initialized:
-            logger.info("Manifest finalized: %s", self.manifest_path)
+        with self._lock:
+            fh, self._fh = self._fh, None
+            appender, self._appender = self._appender, None
+        if appender is not None:
+            appender.close()
+        if fh is None:
+            return
+
+        try:
+            os.fsync(fh.fileno())
+        except OSError as e:
+            logger.error("Failed to sync manifest: %s", e)
+        finally:
+            fh.close()
+        logger.info("Manifest finalized: %s", self.manifest_path)
 
     def __enter__(self) -> "ManifestManager":
         """Context manager entry - initialize manifest."""
@@ -185,26 +300,29 @@ class ManifestUndoer:
         manifests: List[ManifestInfo] = []
 
         try:
-            for path in self.manifest_dir.glob("isort_manifest_*.txt"):
-                # Extract timestamp from filename: isort_manifest_YYYYMMDD_HHMMSS.txt
-                try:
-                    name = path.stem  # isort_manifest_YYYYMMDD_HHMMSS
-                    timestamp_str = name.replace("isort_manifest_", "")
-                    dt = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                    timestamp = int(dt.timestamp())
-                    formatted_date = dt.strftime("%Y-%m-%d %H:%M:%S")
+            with os.scandir(self.manifest_dir) as entries:
+                for entry in entries:
+                    # isort_manifest_YYYYMMDD_HHMMSS.txt
+                    match = _MANIFEST_NAME_RE.match(entry.name)
+                    if not match or not entry.is_file():
+                        continue
+                    year, month, day, hour, minute, second = map(int, match.groups())
+                    try:
+                        dt = datetime(year, month, day, hour, minute, second)
+                    except ValueError:
+                        # Skip files with invalid timestamp values
+                        logger.debug(
+                            "Skipping invalid manifest filename: %s", entry.path
+                        )
+                        continue
 
                     manifests.append(
                         ManifestInfo(
-                            path=path,
-                            timestamp=timestamp,
-                            formatted_date=formatted_date,
+                            path=Path(entry.path),
+                            timestamp=int(dt.timestamp()),
+                            formatted_date=dt.strftime("%Y-%m-%d %H:%M:%S"),
                         )
                     )
-                except ValueError:
-                    # Skip files with invalid timestamp format
-                    logger.debug("Skipping invalid manifest filename: %s", path)
-                    continue
 
         except OSError as e:
             logger.error("Failed to list manifests: %s", e)
@@ -220,6 +338,7 @@ class ManifestUndoer:
         log_callback: Optional[LogCallback] = None,
         error_log_callback: Optional[ErrorLogCallback] = None,
         should_cancel: Optional[ShouldCancelCallback] = None,
+        total_count: Optional[int] = None,
     ) -> UndoResult:
         """
         Undo all moves recorded in a manifest file.
@@ -233,6 +352,8 @@ class ManifestUndoer:
             log_callback: Called with status messages
             error_log_callback: Called with (context, file, error) on failures
             should_cancel: Optional callable returning True to stop early
+            total_count: Move count if the caller already counted the
+                manifest (skips the counting pass)
 
         Returns:
             UndoResult with success/failed/total counts
@@ -245,72 +366,45 @@ class ManifestUndoer:
                 log_callback(f"Manifest not found: {manifest_path}")
             return result
 
-        # Read and parse manifest
-        moves: List[tuple[Path, Path]] = []
+        # Count moves up front (raw bytes, no decode) unless the caller did,
+        # and stream the pairs, so large manifests are never held in memory
         try:
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if not line or line.startswith("#"):
-                        continue
-                    # Parse source|dest format (works with both POSIX and Windows paths)
-                    if "|" not in line:
-                        continue
-
-                    parts = line.split("|", 1)
-                    if len(parts) != 2:
-                        continue
-
-                    source = Path(parts[0])
-                    dest = Path(parts[1])
-                    moves.append((source, dest))
-
+            if total_count is None:
+                total_count = self.count_moves(manifest_path)
+            result.total_count = total_count
         except OSError as e:
             logger.error("Failed to read manifest: %s", e)
             if log_callback:
                 log_callback(f"Failed to read manifest: {e}")
             return result
 
-        result.total_count = len(moves)
-
         if log_callback:
             log_callback(f"Undoing {result.total_count} moves from manifest")
 
         # Reverse each move (dest → source)
-        for i, (source, dest) in enumerate(moves):
-            # Check for cancellation before each file
-            if should_cancel is not None and should_cancel():
-                if log_callback:
-                    log_callback(f"Undo cancelled after {result.success_count} files")
-                break
-
-            try:
-                # Check if destination file exists
-                if not dest.exists():
-                    logger.warning("Destination file missing, skipping: %s", dest)
-                    if error_log_callback:
-                        error_log_callback("UNDO_MISSING", str(dest), "File not found")
-                    result.failed_count += 1
-                    continue
-
-                # Recreate source directory if needed
-                source.parent.mkdir(parents=True, exist_ok=True)
+        created_dirs: Set[str] = set()
+        try:
+            for i, (source, dest) in enumerate(self._iter_moves(manifest_path)):
+                # Check for cancellation before each file
+                if should_cancel is not None and should_cancel():
+                    if log_callback:
+                        log_callback(
+                            f"Undo cancelled after {result.success_count} files"
+                        )
+                    break
 
-                # Move file back to original location
-                shutil.move(str(dest), str(source))
-                result.success_count += 1
-                logger.debug("Restored: %s -> %s", dest, source)
+                self._restore_move(
+                    source, dest, result, error_log_callback, created_dirs
+                )
 
-            except (OSError, shutil.Error) as e:
-                logger.error("Failed to restore %s: %s", dest, e)
-                if error_log_callback:
-                    error_log_callback("UNDO_FAILED", str(dest), str(e))
-                result.failed_count += 1
-
-            # Progress callback
-            if progress_callback:
-                progress_callback(i + 1, result.total_count)
+                # Progress callback
+                if progress_callback:
+                    progress_callback(i + 1, result.total_count)
+        except OSError as e:
+            # Manifest became unreadable mid-undo; report what was restored
+            logger.error("Failed to read manifest: %s", e)
+            if log_callback:
+                log_callback(f"Failed to read manifest: {e}")
 
         if log_callback:
             log_callback(
@@ -320,6 +414,143 @@ class ManifestUndoer:
 
         return result
 
+    @staticmethod
+    def _restore_move(
+        source: str,
+        dest: str,
+        result: UndoResult,
+        error_log_callback: Optional[ErrorLogCallback],
+        created_dirs: Set[str],
+    ) -> None:
+        """
+        Move one file back (dest → source) and count the outcome in result.
+
+        created_dirs holds source directories already ensured during this
+        undo, so each is only mkdir'd once.
+        """
+        try:
+            # Check if destination file exists
+            if not os.path.exists(dest):
+                logger.warning("Destination file missing, skipping: %s", dest)
+                if error_log_callback:
+                    error_log_callback("UNDO_MISSING", dest, "File not found")
+                result.failed_count += 1
+                return
+
+            # Recreate source directory if needed
+            source_dir = os.path.dirname(source)
+            if source_dir and source_dir not in created_dirs:
+                os.makedirs(source_dir, exist_ok=True)
+                created_dirs.add(source_dir)
+
+            # Move file back to original location: a single rename on the
+            # same volume, copy + delete only across devices
+            try:
+                os.replace(dest, source)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(dest, source)
+            result.success_count += 1
+            logger.debug("Restored: %s -> %s", dest, source)
+
+        except (OSError, shutil.Error) as e:
+            logger.error("Failed to restore %s: %s", dest, e)
+            if error_log_callback:
+                error_log_callback("UNDO_FAILED", dest, str(e))
+            result.failed_count += 1
+
+    @staticmethod
+    def count_moves(manifest_path: Path | str) -> int:
+        """
+        Count move records in a manifest without decoding it.
+
+        Args:
+            manifest_path: Path to manifest file
+
+        Returns:
+            Number of recorded moves
+
+        Raises:
+            OSError: If the manifest cannot be read
+        """
+        manifest_path = Path(manifest_path)
+
+        count = 0
+        tail = b""
+        with open(manifest_path, "rb") as f:
+            _advise_sequential(f.fileno())
+            while True:
+                chunk = f.read(_COUNT_BLOCK_SIZE)
+                if not chunk:
+                    break
+                block = tail + chunk
+                cut = block.rfind(b"\n") + 1
+                count += _count_text_records(block[:cut])
+                tail = block[cut:]
+        return count + _count_text_records(tail)
+
+    @staticmethod
+    def estimate_moves(
+        manifest_path: Path | str, sample_bytes: int = MANIFEST_SAMPLE_BYTES
+    ) -> Tuple[int, bool]:
+        """
+        Estimate move records in a manifest from a sample of its start.
+
+        Records in the first sample_bytes are counted and scaled by file
+        size, so listing many large manifests costs one small read each.
+        Manifests that fit in the sample are counted exactly.
+
+        Args:
+            manifest_path: Path to a manifest
+            sample_bytes: Bytes to read from the start of the file
+
+        Returns:
+            (count, exact) - exact is False when count is an estimate
+
+        Raises:
+            OSError: If the manifest cannot be read
+        """
+        with open(manifest_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            sample = f.read(sample_bytes) if size > sample_bytes else b""
+        if not sample:
+            return ManifestUndoer.count_moves(manifest_path), True
+
+        sampled = sample.rfind(b"\n") + 1
+        count = _count_text_records(sample[:sampled])
+        if not count:
+            # Records longer than the sample; nothing to scale from
+            return ManifestUndoer.count_moves(manifest_path), True
+        return round(count * size / sampled), False
+
+    @staticmethod
+    def _iter_moves(manifest_path: Path) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (source, dest) path strings from a manifest, skipping comments.
+
+        Raises:
+            OSError: If the manifest cannot be read
+        """
+        # newline="": strip() below already drops "\r", so skip the
+        # universal-newline translation pass. surrogateescape undoes the
+        # writer's encoding of paths with undecodable bytes.
+        with open(
+            manifest_path, "r", encoding="utf-8", errors="surrogateescape", newline=""
+        ) as f:
+            for line in f:
+                # Parse source|dest format (works with both POSIX and Windows
+                # paths); blank lines are rejected here without a strip() copy
+                if "|" not in line:
+                    continue
+                line = line.strip()
+                # Skip comments
+                if line.startswith("#"):
+                    continue
+
+                source, dest = line.split("|", 1)
+                yield source, dest
+
     def delete_manifest(self, manifest_path: Path | str) -> bool:
         """
         Delete a manifest file.
@@ -333,10 +564,11 @@ class ManifestUndoer:
         manifest_path = Path(manifest_path)
 
         try:
-            if manifest_path.exists():
-                manifest_path.unlink()
-                logger.info("Deleted manifest: %s", manifest_path)
-                return True
+            # unlink() reports a missing file itself; no separate exists() stat
+            manifest_path.unlink()
+            logger.info("Deleted manifest: %s", manifest_path)
+            return True
+        except FileNotFoundError:
             return False
         except OSError as e:
             logger.error("Failed to delete manifest: %s", e)
@@ -349,5 +581,6 @@ __all__ = [
     "ManifestInfo",
     "UndoResult",
     "DEFAULT_MANIFEST_DIR",
+    "MANIFEST_SAMPLE_BYTES",
     "ShouldCancelCallback",
 ]
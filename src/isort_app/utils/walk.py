@@ -0,0 +1,53 @@
+# utils/walk.py
+"""
+Fast recursive file listing for read-only folder scans.
+
+Path.rglob("*") followed by a stat() per result costs one syscall per
+file just to tell files from folders. os.scandir() already gets the
+entry type from the directory read (d_type), so walk_fast() only stats
+symlinks, whose targets scandir cannot see.
+
+Usage:
+    for filepath in walk_fast(folder):
+        size = os.stat(filepath).st_size
+"""
+
+import os
+from pathlib import Path
+from typing import Callable, Iterator, Union
+
+WalkFunction = Callable[[Union[str, Path]], Iterator[Path]]
+
+
+def walk_fast(root: Union[str, Path]) -> Iterator[Path]:
+    """
+    Yield every regular file below root, recursively.
+
+    Matches rglob("*") filtered by Path.is_file(): symlinks to files are
+    included, symlinked folders are not descended into, and unreadable
+    folders are skipped silently.
+
+    Args:
+        root: Folder to walk
+
+    Yields:
+        Path of each regular file
+    """
+    # Explicit stack instead of recursion: no generator chain per level
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+__all__ = ["WalkFunction", "walk_fast"]